@@ -0,0 +1,429 @@
+"""Benchmarks of the linesplan functions
+
+Times the public functions of `linesplan.lines` and `linesplan.dxfreader`
+on the bundled lines plans and on synthetic hulls with increasing numbers
+of frames and points. Results are written as JSON, which can be compared
+with the results of another commit:
+
+    python benchmarks/bench_linesplan.py -o new.json --compare old.json
+"""
+
+import argparse
+import inspect
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import timeit
+from pathlib import Path
+
+import numpy as np
+
+scriptdir = Path(__file__).resolve().parent
+sys.path.insert(0, str(scriptdir.parent / "src"))
+
+from linesplan import dxfreader, lines  # noqa: E402
+from linesplan.lines import *  # noqa: E402,F403
+from linesplan.surface import HullSurface  # noqa: E402
+
+datadir = scriptdir.parent / "tests" / "data"
+
+# Functions that are not benchmarked
+EXCLUDED = {
+    "plot_frames": "interactive",
+    "plot_waterlines": "interactive",
+    "Object": "base class",
+    "Kinked": "base class",
+    "Vertical": "no hydrostatics",
+    "Line": "no hydrostatics",
+}
+
+
+def synthetic_frames(frame_count, point_count, length=10.0, beam=3.0, depth=2.0):
+    """Get frames of a Wigley type hull
+
+    :param frame_count: Number of frames
+    :param point_count: Number of points of each frame, including the deck
+        point at the center line
+    :return: List of half frames with the deck edge as chine
+    """
+    frames = []
+    for x in np.linspace(0, length, frame_count):
+        ratio = 1 - (2 * x / length - 1) ** 2
+        zs = np.linspace(0, depth, point_count - 1)
+        ys = beam / 2 * max(ratio, 1e-3) * (1 - (1 - zs / depth) ** 2)
+        yz = np.column_stack([ys, zs]).tolist() + [[0.0, depth]]
+        frame = Frame(yz, x=float(x))
+        frame.chines = [point_count - 2]
+        frames.append(frame)
+    return frames
+
+
+def synthetic_segments(frame_count, point_count):
+    """Get the segments of synthetic frames in random order, as read from DXF"""
+    segments = []
+    for frame in synthetic_frames(frame_count, point_count):
+        yz = [[y + frame.x * 10, z] for y, z in frame.yz]
+        segments += [yz[: len(yz) // 2 + 1], yz[len(yz) // 2 :]]
+    order = np.random.default_rng(0).permutation(len(segments))
+    return [segments[i] for i in order]
+
+
+def get_cases(frames):
+    """Get benchmark cases for frames
+
+    :param frames: List of half frames
+    :return: Dictionary of name and function to time for each case
+    """
+    frames = list(frames)
+    packed = pack_frames(frames)
+    full = get_full_frames(packed)
+    heeled = get_rotated_frames(full, 0.3)
+    depth = float(packed.points[:, 1].max())
+    draft = 0.4 * depth
+    trimmed = (0.45 * depth, 0.35 * depth)
+    drafts = np.linspace(0.1 * depth, 0.9 * depth, 50)
+    dispvol = get_displacement(packed, draft)
+    lcb = get_lcb(packed, draft)
+    waterline = get_waterline(packed, draft)
+    frame = frames[len(frames) // 2]
+    plan = Lines()
+    plan.name = "benchmark"
+    plan.frames = frames
+    tmp = Path(tempfile.gettempdir())
+    save_lines_plan(plan, tmp / "benchmark.json")
+    save_lines_plan(plan, tmp / "benchmark.lpb", binary=True)
+    bonjean = BonjeanCurves(packed)
+    chine_counts = np.diff(packed.chine_offsets)
+    has_chines = chine_counts.min() > 0 and chine_counts.max() == chine_counts.min()
+
+    def incremental():
+        hydrostatics = IncrementalHydrostatics(frames)
+        hydrostatics.update(draft)
+        frame.touch()
+        hydrostatics.update(draft)
+
+    def cached():
+        plan.enable_cache()
+        for _ in range(10):
+            plan.get_displacement(draft)
+
+    def read_frames():
+        with LinesPlanReader(tmp / "benchmark.json") as reader:
+            for _ in reader:
+                pass
+
+    cases = {
+        "Frame": lambda: Frame(frame.yz, x=frame.x),
+        "PackedFrame": lambda: packed[len(packed) // 2].yz,
+        "PackedFrames": lambda: PackedFrames(frames),
+        "pack_frames": lambda: pack_frames(frames),
+        "Lines": cached,
+        "HydrostaticsCache": cached,
+        "load_lines_plan": lambda: load_lines_plan(tmp / "benchmark.json"),
+        "load_lines_plan[binary]": lambda: load_lines_plan(tmp / "benchmark.lpb"),
+        "save_lines_plan": lambda: save_lines_plan(plan, tmp / "benchmark.json"),
+        "LinesPlanReader": read_frames,
+        "LinesPlanWriter": lambda: save_lines_plan(plan, tmp / "benchmark.json"),
+        "line_segments": lambda: line_segments(waterline),
+        "line_lengths": lambda: line_lengths(waterline),
+        "get_waterline_points": lambda: get_waterline_points(frame, draft),
+        "get_submerged_frame": lambda: get_submerged_frame(frame, draft),
+        "get_frame_drafts": lambda: get_frame_drafts(packed.xs, *trimmed),
+        "get_submerged_sections": lambda: get_submerged_sections(
+            packed, np.full(len(packed), draft)
+        ),
+        "get_waterline_breadths": lambda: get_waterline_breadths(
+            heeled, np.full(len(packed), draft)
+        ),
+        "get_cross_section": lambda: get_cross_section(frame),
+        "get_mom_y": lambda: get_mom_y(frame),
+        "get_mom_z": lambda: get_mom_z(frame),
+        "get_cross_sections": lambda: get_cross_sections(packed),
+        "get_mom_ys": lambda: get_mom_ys(packed),
+        "get_mom_zs": lambda: get_mom_zs(packed),
+        "get_girths": lambda: get_girths(packed),
+        "get_submerged_frames": lambda: get_submerged_frames(packed, *trimmed),
+        "get_displacement": lambda: get_displacement(packed, *trimmed),
+        "get_displacement[list]": lambda: get_displacement(frames, *trimmed),
+        "get_lcb": lambda: get_lcb(packed, *trimmed),
+        "get_waterline": lambda: get_waterline(packed, *trimmed),
+        "get_waterline_arrays": lambda: get_waterline_arrays(packed, drafts),
+        "get_waterline_crossings": lambda: get_waterline_crossings(
+            packed, get_frame_drafts(packed.xs, drafts[:, None])
+        ),
+        "get_waterline_properties": lambda: get_waterline_properties(waterline),
+        "get_waterlines_properties": lambda: get_waterlines_properties(
+            [waterline] * 50
+        ),
+        "get_waterlines": lambda: get_waterlines(packed, drafts),
+        "get_bm": lambda: get_bm(packed, *trimmed),
+        "get_kb": lambda: get_kb(packed, *trimmed),
+        "get_kb[waterlines]": lambda: get_kb(packed, *trimmed, method="waterlines"),
+        "get_kb_from_sections": lambda: get_kb_from_sections(
+            packed.xs,
+            get_cross_sections(packed, full=True),
+            get_mom_zs(packed),
+            *trimmed,
+        ),
+        "get_km": lambda: get_km(packed, *trimmed),
+        "get_lcf": lambda: get_lcf(packed, *trimmed),
+        "get_hull_volume": lambda: get_hull_volume(packed),
+        "get_wetted_surface": lambda: get_wetted_surface(packed, *trimmed),
+        "adaptive_simpson": lambda: adaptive_simpson(
+            packed.xs, lambda i: get_cross_sections(packed)[i]
+        ),
+        "get_displacement_adaptive": lambda: get_displacement_adaptive(
+            packed, *trimmed
+        ),
+        "get_lcb_adaptive": lambda: get_lcb_adaptive(packed, *trimmed),
+        "get_hull_volume_adaptive": lambda: get_hull_volume_adaptive(packed),
+        "get_wetted_surface_adaptive": lambda: get_wetted_surface_adaptive(
+            packed, *trimmed
+        ),
+        "HydrostaticState": lambda: HydrostaticState(packed, *trimmed).km,
+        "IncrementalHydrostatics": incremental,
+        "BonjeanCurves": lambda: BonjeanCurves(packed),
+        "BonjeanCurves.evaluate": lambda: bonjean.evaluate(
+            get_frame_drafts(packed.xs, drafts[:, None])
+        ),
+        "hydrostatic_table": lambda: hydrostatic_table(packed, drafts),
+        "get_full_frames": lambda: get_full_frames(packed),
+        "get_rotated_frames": lambda: get_rotated_frames(full, 0.3),
+        "submerge_frames": lambda: submerge_frames(get_full_frames(packed), draft, 0.1),
+        "get_submerged_properties": lambda: get_submerged_properties(full, draft, 0.1),
+        "float_frames": lambda: float_frames(full, dispvol, lcb),
+        "gz_curve": lambda: gz_curve(
+            packed, dispvol, lcb, 0.5 * depth, np.radians([5, 10, 15, 20])
+        ),
+    }
+    if has_chines:
+        cases["get_hull_areas"] = lambda: get_hull_areas(packed)
+        cases["resample_frames"] = lambda: resample_frames(packed, 100)
+        cases["HullSurface"] = lambda: HullSurface(packed).get_uniform_stations(
+            2 * len(packed) + 1
+        )
+    return cases
+
+
+def get_dxf_cases(frame_count, point_count):
+    """Get benchmark cases of the DXF reader"""
+    segments = synthetic_segments(frame_count, point_count)
+    spline = dxfreader.Spline()
+    spline.points = [[i, i**2] for i in range(point_count)]
+    spline.knots = [0] * 4 + list(range(1, point_count - 3)) + [point_count - 3] * 4
+    return {
+        "collect_frames": lambda: dxfreader.collect_frames(
+            [list(segment) for segment in segments]
+        ),
+        "Spline.to_line": lambda: spline.to_line(point_count),
+    }
+
+
+def get_uncovered():
+    """Get names of public functions and classes of lines without benchmark"""
+    names = set(get_cases(synthetic_frames(5, 10))) | set(EXCLUDED)
+    names = {name.split("[")[0].split(".")[0] for name in names}
+    return sorted(
+        name
+        for name, value in vars(lines).items()
+        if not name.startswith("_")
+        and getattr(value, "__module__", None) == lines.__name__
+        and (inspect.isfunction(value) or inspect.isclass(value))
+        and name not in names
+    )
+
+
+def time_function(function, repeat=5, min_time=0.05):
+    """Time function
+
+    :param function: Function without arguments
+    :param repeat: Number of repetitions
+    :param min_time: Minimum time of each repetition in seconds
+    :return: Dictionary with the minimum and median time per call in seconds
+    """
+    timer = timeit.Timer(function)
+    number = 1
+    while True:
+        elapsed = timer.timeit(number)
+        if elapsed >= min_time or number >= 1 << 20:
+            break
+        number *= max(2, int(min_time / max(elapsed, 1e-9)))
+    times = [elapsed / number] + [t / number for t in timer.repeat(repeat - 1, number)]
+    return {"min": min(times), "median": statistics.median(times), "number": number}
+
+
+def get_hulls(quick=False):
+    """Get hulls to benchmark
+
+    :return: List of (hull name, frames) tuples
+    """
+    hulls = [
+        (name, load_lines_plan(datadir / f"{name}.json").frames)
+        for name in ("grendel_sailer", "tally_ho")
+    ]
+    frame_counts = (11, 41) if quick else (11, 21, 41, 81, 161)
+    point_counts = (51, 201) if quick else (51, 101, 201, 401, 801)
+    hulls += [
+        (f"synthetic_{frame_count}x{point_counts[0]}", frame_count, point_counts[0])
+        for frame_count in frame_counts
+    ]
+    hulls += [
+        (f"synthetic_{frame_counts[0]}x{point_count}", frame_counts[0], point_count)
+        for point_count in point_counts[1:]
+    ]
+    return [
+        hull if len(hull) == 2 else (hull[0], synthetic_frames(*hull[1:]))
+        for hull in hulls
+    ]
+
+
+def run(quick=False, pattern=None, repeat=5):
+    """Run benchmarks
+
+    :param quick: Whether to use fewer and smaller hulls
+    :param pattern: Only run benchmarks with names containing pattern
+    :param repeat: Number of repetitions of each benchmark
+    :return: List of result dictionaries
+    """
+    results = []
+    for hull, frames in get_hulls(quick):
+        counts = [len(frame) for frame in frames]
+        cases = get_cases(frames)
+        if hull.startswith("synthetic"):
+            cases.update(get_dxf_cases(len(frames), counts[0]))
+        for name, function in cases.items():
+            if pattern and pattern not in name:
+                continue
+            timing = time_function(function, repeat)
+            results.append(
+                {
+                    "name": name,
+                    "hull": hull,
+                    "frames": len(frames),
+                    "points": sum(counts),
+                    **timing,
+                }
+            )
+            print(f"{name:32s} {hull:24s} {timing['min'] * 1e3:12.4f} ms", flush=True)
+    return results
+
+
+def get_scaling(results):
+    """Get scaling exponents of the times with the numbers of frames and points
+
+    The exponent is the slope of a straight line fit of log(time) against
+    log(frames) on the synthetic hulls with the smallest number of points
+    per frame, and likewise against log(points per frame) on those with the
+    smallest number of frames.
+
+    :param results: List of result dictionaries
+    :return: Dictionary of name and dictionary with the exponents
+    """
+    synthetic = [r for r in results if r["hull"].startswith("synthetic")]
+    if not synthetic:
+        return {}
+    sizes = {r["hull"]: (r["frames"], r["points"] // r["frames"]) for r in synthetic}
+    min_frames = min(frames for frames, points in sizes.values())
+    min_points = min(points for frames, points in sizes.values())
+    scaling = {}
+    for name in dict.fromkeys(r["name"] for r in synthetic):
+        exponents = {}
+        for key, axis, fixed in (("frames", 0, min_points), ("points", 1, min_frames)):
+            curve = [
+                (sizes[r["hull"]][axis], r["min"])
+                for r in synthetic
+                if r["name"] == name and sizes[r["hull"]][1 - axis] == fixed
+            ]
+            if len(curve) > 1:
+                x, t = np.log(np.array(curve)).T
+                exponents[key] = float(np.polyfit(x, t, 1)[0])
+        scaling[name] = exponents
+    return scaling
+
+
+def get_metadata():
+    """Get description of the environment of the benchmarks"""
+    try:
+        commit = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=scriptdir,
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        commit = None
+    return {
+        "commit": commit,
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "platform": platform.platform(),
+        "processor": platform.processor(),
+    }
+
+
+def compare(results, baseline, threshold=1.2):
+    """Print ratios of the times of results and baseline
+
+    :param results: List of result dictionaries
+    :param baseline: List of result dictionaries of the baseline
+    :param threshold: Ratio above which a result is marked as regression
+    :return: Number of regressions
+    """
+    old = {(r["name"], r["hull"]): r["min"] for r in baseline}
+    regressions = 0
+    for result in results:
+        key = (result["name"], result["hull"])
+        if key not in old:
+            continue
+        ratio = result["min"] / old[key]
+        mark = ""
+        if ratio > threshold:
+            mark = "  REGRESSION"
+            regressions += 1
+        print(f"{key[0]:32s} {key[1]:24s} {ratio:8.2f}x{mark}")
+    return regressions
+
+
+def main(args=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("-o", "--output", help="JSON file to write results to")
+    parser.add_argument("-c", "--compare", help="JSON file with baseline results")
+    parser.add_argument("-k", "--pattern", help="Only run matching benchmarks")
+    parser.add_argument("-q", "--quick", action="store_true", help="Small hulls only")
+    parser.add_argument("-r", "--repeat", type=int, default=5)
+    parser.add_argument(
+        "-t",
+        "--threshold",
+        type=float,
+        default=1.2,
+        help="Time ratio to report as regression",
+    )
+    args = parser.parse_args(args)
+    uncovered = get_uncovered()
+    if uncovered:
+        print("Not benchmarked:", ", ".join(uncovered))
+    results = run(args.quick, args.pattern, args.repeat)
+    scaling = get_scaling(results)
+    print(f"\n{'scaling exponent':32s} {'frames':>8s} {'points':>8s}")
+    for name, exponents in scaling.items():
+        frames, points = (exponents.get(key, np.nan) for key in ("frames", "points"))
+        print(f"{name:32s} {frames:8.2f} {points:8.2f}")
+    if args.output:
+        output = Path(args.output)
+        output.parent.mkdir(parents=True, exist_ok=True)
+        with open(output, "w") as f:
+            data = {"metadata": get_metadata(), "results": results, "scaling": scaling}
+            json.dump(data, f, indent=2)
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)["results"]
+        return 1 if compare(results, baseline, args.threshold) else 0
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,97 @@
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+from .lines import (
+    HydrostaticState,
+    PackedFrames,
+    float_frames,
+    get_full_frames,
+    gz_curve,
+    pack_frames,
+)
+
+# Lines plan of the worker process, set once by init_worker
+_frames = None
+_full_frames = None
+
+
+def init_worker(xs, points, offsets):
+    """Set up the lines plan in a worker process
+
+    :param xs: X positions of the half frames
+    :param points: Packed points of the half frames
+    :param offsets: Offsets of the frames in points
+    """
+    global _frames, _full_frames
+    _frames = PackedFrames.from_arrays(xs, points, offsets)
+    _full_frames = get_full_frames(_frames)
+
+
+def evaluate_condition(condition, heel_angles=None):
+    """Evaluate a loading condition with the lines plan of this worker
+
+    :param condition: Tuple of displacement volume, LCB and KG
+    :param heel_angles: Heel angles (radians) to get righting arms for
+    :return: Dictionary with the condition, draft, trim, KM, GM and
+        optionally the righting arms in "gz"
+    """
+    return get_condition_result(_frames, _full_frames, condition, heel_angles)
+
+
+def get_condition_result(frames, full_frames, condition, heel_angles=None):
+    """Evaluate a loading condition
+
+    :param frames: Packed half frames
+    :param full_frames: Full frames of the half frames (see `get_full_frames`)
+    :param condition: Tuple of displacement volume, LCB and KG
+    :param heel_angles: Heel angles (radians) to get righting arms for
+    :return: Dictionary with the condition, draft, trim, KM, GM and
+        optionally the righting arms in "gz"
+    """
+    dispvol, lcb, kg = condition
+    draft, trim = float_frames(full_frames, dispvol, lcb)
+    km = HydrostaticState(frames, draft, draft - trim).km
+    result = {
+        "dispvol": dispvol,
+        "lcb": lcb,
+        "kg": kg,
+        "draft": draft,
+        "trim": trim,
+        "km": km,
+        "gm": km - kg,
+    }
+    if heel_angles is not None:
+        result["gz"] = gz_curve(frames, dispvol, lcb, kg, heel_angles)["gz"]
+    return result
+
+
+def evaluate_conditions(
+    frames, conditions, heel_angles=None, max_workers=None, chunksize=1
+):
+    """Evaluate loading conditions in a pool of worker processes
+
+    The lines plan is sent to each worker once when it starts. Results are
+    yielded in the order of the conditions as they become available.
+
+    :param frames: List of half frames
+    :param conditions: Iterable of (displacement volume, LCB, KG) tuples
+    :param heel_angles: Heel angles (radians) to get righting arms for
+    :param max_workers: Number of worker processes. Defaults to the number of CPUs.
+        With 1, conditions are evaluated in this process.
+    :param chunksize: Number of conditions sent to a worker at once
+    :return: Generator of result dictionaries (see `evaluate_condition`)
+    """
+    frames = pack_frames(frames)
+    if max_workers == 1:
+        full_frames = get_full_frames(frames)
+        evaluate = partial(
+            get_condition_result, frames, full_frames, heel_angles=heel_angles
+        )
+        yield from map(evaluate, conditions)
+        return
+    initargs = (frames.xs, frames.points, frames.offsets)
+    evaluate = partial(evaluate_condition, heel_angles=heel_angles)
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=init_worker, initargs=initargs
+    ) as executor:
+        yield from executor.map(evaluate, conditions, chunksize=chunksize)
@@ -0,0 +1,248 @@
+"""Command line runner of hydrostatics on lines plans
+
+Examples:
+
+    linesplan table plan.json --drafts 0.5:2.0:16 --trims -0.2,0,0.2 -o table.csv
+    linesplan float a.json b.json --displacement 10,12 --lcb 6.5 --kg 1.2
+    linesplan gz plan.json --displacement 12 --lcb 6.5 --kg 1.2 --heels 0:60:13 -o gz.npz
+
+Work is split into units of one plan and one trim or condition. Units are
+evaluated in a pool of worker processes and their results are written as
+soon as they are available, so rows are not in input order.
+"""
+
+import argparse
+import csv
+import io
+import itertools
+import sys
+import zipfile
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from pathlib import Path
+
+import numpy as np
+
+from .batch import get_condition_result
+from .lines import get_full_frames, gz_curve, hydrostatic_table, load_lines_plan
+
+# Lines plans loaded by this process, by filename
+_plans = {}
+
+
+def _get_plan(filename):
+    """Get packed half frames and full frames of plan, loading it once"""
+    if filename not in _plans:
+        frames = load_lines_plan(filename, packed=True).frames
+        _plans[filename] = frames, get_full_frames(frames)
+    return _plans[filename]
+
+
+def _get_records(fields):
+    """Get structured array from dictionary of equally long columns"""
+    columns = {name: np.atleast_1d(values) for name, values in fields.items()}
+    result = np.zeros(
+        len(next(iter(columns.values()))),
+        dtype=[(name, values.dtype) for name, values in columns.items()],
+    )
+    for name, values in columns.items():
+        result[name] = values
+    return result
+
+
+def evaluate_unit(unit):
+    """Evaluate a unit of work
+
+    :param unit: Tuple of command, plan filename and parameters. For "table"
+        the parameters are the drafts at the aft perpendicular and the trim,
+        for "float" the condition (displacement volume, LCB, KG) and for "gz"
+        the condition and the heel angles in degrees.
+    :return: Structured array with the results
+    """
+    command, filename, *parameters = unit
+    frames, full_frames = _get_plan(filename)
+    if command == "table":
+        drafts, trim = parameters
+        drafts = np.asarray(drafts, dtype=float)
+        return hydrostatic_table(frames, drafts, drafts - trim)
+    if command == "float":
+        (condition,) = parameters
+        result = get_condition_result(frames, full_frames, condition)
+        return _get_records(result)
+    if command == "gz":
+        (dispvol, lcb, kg), heels = parameters
+        curve = gz_curve(frames, dispvol, lcb, kg, np.radians(heels))
+        fields = {"dispvol": dispvol, "lcb": lcb, "kg": kg}
+        fields = {name: np.full(len(curve), value) for name, value in fields.items()}
+        fields.update({name: curve[name] for name in curve.dtype.names})
+        fields["heel"] = np.degrees(curve["heel"])
+        return _get_records(fields)
+    raise ValueError(f"Unknown command: {command}")
+
+
+def evaluate_units(units, max_workers=None):
+    """Evaluate units of work in a pool of worker processes
+
+    :param units: List of units (see `evaluate_unit`)
+    :param max_workers: Number of worker processes. Defaults to the number of CPUs.
+        With 1, units are evaluated in this process.
+    :return: Generator of (unit index, results) tuples in order of completion
+    """
+    if max_workers == 1:
+        for i, unit in enumerate(units):
+            yield i, evaluate_unit(unit)
+        return
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(evaluate_unit, unit): i for i, unit in enumerate(units)
+        }
+        for future in as_completed(futures):
+            yield futures[future], future.result()
+
+
+class CsvWriter:
+    """Writer of results as CSV rows with the plan as first column"""
+
+    def __init__(self, filename=None):
+        if filename is None:
+            self._file = io.TextIOWrapper(
+                sys.stdout.buffer, newline="", write_through=True
+            )
+            self._close = False
+        else:
+            self._file = open(filename, "w", newline="")
+            self._close = True
+        self._writer = csv.writer(self._file)
+        self._header = False
+
+    def write(self, plan, index, results):
+        if not self._header:
+            self._writer.writerow(("plan",) + results.dtype.names)
+            self._header = True
+        for row in results.tolist():
+            self._writer.writerow((plan,) + tuple(row))
+        self._file.flush()
+
+    def close(self):
+        if self._close:
+            self._file.close()
+        else:
+            self._file.detach()
+
+
+class NpzWriter:
+    """Writer of results as arrays in an NPZ file
+
+    The arrays are named after the stem of the plan filename and the index of
+    the unit.
+    """
+
+    def __init__(self, filename):
+        self._zip = zipfile.ZipFile(filename, "w")
+
+    def write(self, plan, index, results):
+        name = f"{Path(plan).stem}_{index}"
+        with self._zip.open(f"{name}.npy", "w") as f:
+            np.lib.format.write_array(f, results, allow_pickle=False)
+
+    def close(self):
+        self._zip.close()
+
+
+def parse_grid(text):
+    """Parse grid of values
+
+    :param text: "start:stop:count" for evenly spaced values, or comma separated values
+    :return: Array of values
+    """
+    if ":" in text:
+        start, stop, count = text.split(":")
+        return np.linspace(float(start), float(stop), int(count))
+    return np.array([float(value) for value in text.split(",")])
+
+
+def get_units(args):
+    """Get units of work for parsed arguments"""
+    units = []
+    for plan in args.plans:
+        if args.command == "table":
+            units += [("table", plan, args.drafts, trim) for trim in args.trims]
+            continue
+        conditions = itertools.product(args.displacement, args.lcb, args.kg)
+        for condition in conditions:
+            condition = tuple(float(value) for value in condition)
+            if args.command == "float":
+                units.append(("float", plan, condition))
+            else:
+                units.append(("gz", plan, condition, args.heels))
+    return units
+
+
+def get_parser():
+    parser = argparse.ArgumentParser(
+        prog="linesplan", description="Hydrostatics of lines plans"
+    )
+    subparsers = parser.add_subparsers(dest="command", required=True)
+    grid = "start:stop:count or comma separated values"
+    table = subparsers.add_parser("table", help="Hydrostatic tables")
+    table.add_argument("--drafts", type=parse_grid, required=True, help=grid)
+    table.add_argument("--trims", type=parse_grid, default=np.zeros(1), help=grid)
+    for name, help in (
+        ("float", "Equilibrium draft and trim of loading conditions"),
+        ("gz", "Righting arm curves of loading conditions"),
+    ):
+        subparser = subparsers.add_parser(name, help=help)
+        subparser.add_argument("--displacement", type=parse_grid, required=True)
+        subparser.add_argument("--lcb", type=parse_grid, required=True)
+        subparser.add_argument(
+            "--kg", type=parse_grid, required=name == "gz", default=np.zeros(1)
+        )
+        if name == "gz":
+            subparser.add_argument(
+                "--heels", type=parse_grid, required=True, help=f"Degrees, {grid}"
+            )
+    for subparser in subparsers.choices.values():
+        subparser.add_argument("plans", nargs="+", help="Lines plan files")
+        subparser.add_argument(
+            "-o", "--output", help="CSV or NPZ file. CSV to standard output by default"
+        )
+        subparser.add_argument(
+            "-f",
+            "--format",
+            choices=("csv", "npz"),
+            help="Output format. From extension of output file by default",
+        )
+        subparser.add_argument(
+            "-j",
+            "--jobs",
+            type=int,
+            help="Number of processes. Number of CPUs by default",
+        )
+    return parser
+
+
+def main(args=None):
+    """Run command line
+
+    :param args: List of arguments. From sys.argv when not provided
+    """
+    args = get_parser().parse_args(args)
+    units = get_units(args)
+    format = args.format
+    if format is None:
+        format = "npz" if args.output and Path(args.output).suffix == ".npz" else "csv"
+    if format == "npz":
+        if args.output is None:
+            raise SystemExit("NPZ output requires an output file")
+        writer = NpzWriter(args.output)
+    else:
+        writer = CsvWriter(args.output)
+    try:
+        for i, results in evaluate_units(units, args.jobs):
+            writer.write(units[i][1], i, results)
+    finally:
+        writer.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -38,15 +38,25 @@ class Arc:
 
 
 class Dxf:
+    """DXF drawing with cached access to its entities
+
+    The entities of a block are read once, on the first request for that
+    block, and kept as NumPy arrays by layer and type. Requests for other
+    layers and types of the same block come from the cache.
+    """
+
     _doc = None
+    _types = ("LINE", "LWPOLYLINE", "SPLINE", "ARC")
 
     def __init__(self, *args, **kwargs):
         super().__init__()
+        self._entities = {}
         if len(args):
             self.load(args[0])
 
     def load(self, filename):
         self._doc = ezdxf.readfile(filename)
+        self._entities = {}
 
     def check_loaded(self):
         if self._doc is None:
@@ -62,76 +72,136 @@ class Dxf:
         self.check_loaded()
         return [layer.dxf.name for layer in self._doc.layers]
 
+    def _read_block(self, block):
+        """Read entities of block (modelspace when None) by layer and type"""
+        self.check_loaded()
+        src = self._doc.blocks[block] if block else self._doc.modelspace()
+        entities = {}
+        for entity in src:
+            kind = entity.dxftype()
+            if kind not in self._types:
+                continue
+            if kind == "LINE":
+                start, end = entity.dxf.start, entity.dxf.end
+                data = np.array([[start.x, start.y], [end.x, end.y]], dtype=float)
+            elif kind == "LWPOLYLINE":
+                data = np.array(entity.get_points("xy"), dtype=float).reshape(-1, 2)
+            elif kind == "SPLINE":
+                points = np.array(entity.control_points, dtype=float).reshape(-1, 3)
+                data = points[:, :2], np.array(entity.knots, dtype=float)
+            else:
+                center = entity.dxf.center
+                data = (
+                    np.array([center.x, center.y], dtype=float),
+                    entity.dxf.radius,
+                    entity.dxf.start_angle,
+                    entity.dxf.end_angle,
+                )
+            # Entities of all layers are kept in drawing order as well
+            for layer in (entity.dxf.layer, None):
+                entities.setdefault((layer, kind), []).append(data)
+        return entities
+
+    def _get_entities(self, kind, block=None, layer=None):
+        """Get cached data of entities of type kind in block and layer"""
+        block = block or None
+        entities = self._entities.get(block)
+        if entities is None:
+            entities = self._entities[block] = self._read_block(block)
+        return entities.get((layer or None, kind), [])
+
     def get_lines(self, block=None, layer=None):
         result = []
-        if block:
-            src = self._doc.blocks[block]
-        else:
-            src = self._doc.modelspace()
-        layer = '[layer=="%s"]' % layer if layer else ""
-        for l in src.query("LINE" + layer):
-            line = [list(l.dxf.start[:2]), list(l.dxf.end[:2])]
-            result.append(line)
-        for l in src.query("LWPOLYLINE" + layer):
-            line = [list(vert) for vert in l.vertices()]
-            result.append(line)
+        for kind in ("LINE", "LWPOLYLINE"):
+            result += [
+                points.tolist() for points in self._get_entities(kind, block, layer)
+            ]
         return result
 
     def get_splines(self, block=None, layer=None):
         result = []
-        if block:
-            src = self._doc.blocks[block]
-        else:
-            src = self._doc.modelspace()
-        layer = '[layer=="%s"]' % layer if layer else ""
-        for s in src.query("SPLINE" + layer):
+        for points, knots in self._get_entities("SPLINE", block, layer):
             spline = Spline()
-            spline.points = [list(point[:2]) for point in s.control_points]
-            spline.knots = [knot for knot in s.knots]
+            spline.points = points.tolist()
+            spline.knots = knots.tolist()
             result.append(spline)
         return result
 
     def get_arcs(self, block=None, layer=None):
         result = []
-        if block:
-            src = self._doc.blocks[block]
-        else:
-            src = self._doc.modelspace()
-        layer = '[layer=="%s"]' % layer if layer else ""
-        for a in src.query("ARC" + layer):
+        for center, radius, start_angle, end_angle in self._get_entities(
+            "ARC", block, layer
+        ):
             arc = Arc()
-            arc.center = list(a.dxf.center[:2])
-            arc.radius = a.dxf.radius
-            arc.start_angle = a.dxf.start_angle
-            arc.end_angle = a.dxf.end_angle
+            arc.center = center.tolist()
+            arc.radius = radius
+            arc.start_angle = start_angle
+            arc.end_angle = end_angle
             result.append(arc)
         return result
 
 
 def collect_frames(lines, threshold=2e-3):
+    """Join line segments into frames
+
+    Segments are joined when their end points are closer than threshold. The
+    end points are kept in a grid with cells the size of threshold, so a
+    connection is found by looking in the 3 x 3 cells around an end point.
+    Of the connecting segments, the one that comes first in lines is joined.
+    Points where segments join become chines of the frame.
+
+    :param lines: List of segments, which are lists of points. Consumed by
+        this function
+    :param threshold: Maximum distance between joined end points
+    :return: List of frames
+    """
+    segments = list(lines)
+    lines.clear()
+    used = [False] * len(segments)
+
+    def get_cell(p):
+        return math.floor(p[0] / threshold), math.floor(p[1] / threshold)
+
+    cells = {}
+    if threshold > 0:
+        for i, segment in enumerate(segments):
+            for p in (segment[0], segment[-1]):
+                cells.setdefault(get_cell(p), []).append(i)
 
     def points_close(p1, p2):
-        p1 = np.asarray(p1)
-        p2 = np.asarray(p2)
-        return np.linalg.norm(p2 - p1) < threshold
+        return math.sqrt(sum((b - a) * (b - a) for a, b in zip(p1, p2))) < threshold
 
     def check_connection(joined, back):
         end = joined[-back][-back]
-        connected = None
-        for i, line in enumerate(lines):
-            if points_close(end, line[-(not back)]):
-                connected = lines.pop(i)
-            elif points_close(end, line[-back]):
-                connected = lines.pop(i)
-                connected.reverse()
-            else:
-                continue
-            break
+        if threshold <= 0:
+            return None
+        cx, cy = get_cell(end)
+        found = None
+        for dx in (-1, 0, 1):
+            for dy in (-1, 0, 1):
+                for i in cells.get((cx + dx, cy + dy), ()):
+                    if used[i] or (found is not None and i >= found):
+                        continue
+                    segment = segments[i]
+                    if points_close(end, segment[0]) or points_close(end, segment[-1]):
+                        found = i
+        if found is None:
+            return None
+        used[found] = True
+        connected = segments[found]
+        if not points_close(end, connected[-(not back)]):
+            connected.reverse()
         return connected
 
     all_joined = []
-    while lines:
-        joined = [lines.pop(0)]
+    first = 0
+    while True:
+        while first < len(segments) and used[first]:
+            first += 1
+        if first == len(segments):
+            break
+        used[first] = True
+        joined = [segments[first]]
         while True:
             front = check_connection(joined, False)
             if front is not None:
@@ -144,11 +214,11 @@ def collect_frames(lines, threshold=2e-3):
                 break
 
     result = []
-    for segments in all_joined:
+    for joined in all_joined:
         frame = Frame()
-        frame.yz += segments.pop(0)
-        while segments:
+        frame.yz += joined.pop(0)
+        while joined:
             frame.chines.append(len(frame.yz) - 1)
-            frame.yz += segments.pop(0)[1:]
+            frame.yz += joined.pop(0)[1:]
         result.append(frame)
     return result
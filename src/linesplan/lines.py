@@ -1,12 +1,48 @@
-import copy
+import importlib
 import json
+import operator
+import os
+import struct
 import sys
+import tempfile
+import warnings
 from bisect import bisect_left, insort_left
+from collections import OrderedDict
+from collections.abc import MutableSequence
+from functools import cached_property
 
-import matplotlib.pyplot as plt
 import numpy as np
-from scipy.integrate import simpson, trapezoid
-from scipy.optimize import newton_krylov
+
+from .profiling import count, profiled
+
+# Plotting and scipy are imported on first use, to keep importing linesplan
+# fast in batch jobs and in Blender
+_lazy_attributes = {
+    "plot_frames": "linesplan.plot",
+    "plot_waterlines": "linesplan.plot",
+    "NoConvergence": "scipy.optimize",
+}
+
+
+def __getattr__(name):
+    if name in _lazy_attributes:
+        return getattr(importlib.import_module(_lazy_attributes[name]), name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@profiled(points=None)
+def simpson(y, *, x=None, dx=1.0, axis=-1):
+    """Integrate samples with Simpson's rule (see `scipy.integrate.simpson`)"""
+    from scipy.integrate import simpson
+
+    return simpson(y, x=x, dx=dx, axis=axis)
+
+
+def trapezoid(y, x=None, dx=1.0, axis=-1):
+    """Integrate samples with the trapezoidal rule (see `scipy.integrate.trapezoid`)"""
+    from scipy.integrate import trapezoid
+
+    return trapezoid(y, x=x, dx=dx, axis=axis)
 
 
 class Object:
@@ -30,7 +66,9 @@ class Kinked(Object):
         :param index: Index of non smooth point
         """
         if index not in self.kinks:
-            insort_left(self.kinks, index)
+            kinks = list(self.kinks)
+            insort_left(kinks, index)
+            self.kinks = kinks
 
     def remove_kink(self, index, fail_non_existing=False):
         """Remove kink
@@ -39,24 +77,32 @@ class Kinked(Object):
         :param fail_non_existing: Whether to fail when the kink isn't in the list
         """
         if index in self.kinks or fail_non_existing:
-            self.kinks.remove(index)
+            kinks = list(self.kinks)
+            kinks.remove(index)
+            self.kinks = kinks
 
     def delete_kink(self, index):
         """Delete kink
 
         :param index: Index in list of kinks/chines
         """
-        self.kinks.pop(index)
+        kinks = list(self.kinks)
+        kinks.pop(index)
+        self.kinks = kinks
+
+    def update_kinks(self, index, direction):
+        """Shift kinks after a point was inserted or deleted
 
-    def update_kinks(index, direction):
-        i = bisect_left(self.kinks, index)
-        if direction < 0 and self.kinks[i] == index:
+        :param index: Index of the inserted or deleted point
+        :param direction: 1 for an insertion, -1 for a deletion
+        """
+        kinks = list(self.kinks)
+        i = bisect_left(kinks, index)
+        if direction < 0 and i < len(kinks) and kinks[i] == index:
             j = i + 1
         else:
             j = i
-        self.kinks = [k for k in self.kinks[:i]] + [
-            k + direction for k in self.kinks[j:]
-        ]
+        self.kinks = kinks[:i] + [k + direction for k in kinks[j:]]
 
 
 class Frame(Kinked):
@@ -67,6 +113,7 @@ class Frame(Kinked):
     symmetrical, so the frame only contains one side of hull"""
 
     x = 0.0
+    revision = 0  # Incremented on each modification through the frame's methods
 
     def __init__(self, *args, **kwargs):
         super().__init__()
@@ -78,13 +125,27 @@ class Frame(Kinked):
             self.x = float(kwargs["x"])
         self.chines = []
 
+    @property
+    def kinks(self):
+        """Chines of the frame are its kinks"""
+        return self.chines
+
+    @kinks.setter
+    def kinks(self, kinks):
+        self.chines = kinks
+
+    def touch(self):
+        """Mark the frame as modified"""
+        self.revision += 1
+
     def scale(self, factor):
         """Scale the frame
 
         :param factor: Factor to scale y
         """
         scaled = np.asarray(self.yz) * factor
-        self.yz = [list(i) for i in scaled]
+        self.yz = scaled.tolist()
+        self.touch()
 
     def offset(self, vector):
         """Move the frame in the plane of the frame
@@ -92,7 +153,8 @@ class Frame(Kinked):
         :param vector: Vector (of size 2) to move by.
         """
         offset = np.asarray(self.yz) + np.asarray(vector)
-        self.yz = [list(i) for i in offset]
+        self.yz = offset.tolist()
+        self.touch()
 
     def insert(self, index, yz, chine=False):
         """Insert a point into the frame
@@ -105,6 +167,7 @@ class Frame(Kinked):
         self.update_kinks(index, 1)
         if chine:
             self.add_kink(index)
+        self.touch()
 
     def delete(self, index):
         """Remove point at index
@@ -113,6 +176,7 @@ class Frame(Kinked):
         """
         self.yz.pop(index)
         self.update_kinks(index, -1)
+        self.touch()
 
     def __len__(self):
         """Number of points in the frame"""
@@ -127,6 +191,410 @@ class Frame(Kinked):
         yield self.yz[i:]
 
 
+class PackedFrame(Frame):
+    """Frame that is a view on the point buffer of `PackedFrames`
+
+    Points, x position and chines live in the buffer of the owning
+    `PackedFrames`, so `yz` is a numpy (n, 2) view rather than a list.
+
+    The view refers to the frame by its index. Once frames are inserted,
+    deleted or reordered in the owning `PackedFrames`, the view is stale and
+    using it raises `IndexError`. Use `to_frame` to keep a copy of the frame.
+    """
+
+    def __init__(self, store, index):
+        Kinked.__init__(self)
+        self._store = store
+        self._index = index
+        self._layout = store.layout
+
+    @property
+    def index(self):
+        """Index of the frame in the owning `PackedFrames`"""
+        if self._layout != self._store.layout:
+            raise IndexError("frame view is stale: frames were inserted or removed")
+        return self._index
+
+    def to_frame(self):
+        """Get copy of the frame as `Frame`"""
+        frame = Frame(self.yz.tolist(), x=self.x)
+        frame.chines = list(self.chines)
+        return frame
+
+    @property
+    def x(self):
+        return float(self._store.xs[self.index])
+
+    @x.setter
+    def x(self, x):
+        self._store.set_frame_x(self.index, x)
+
+    @property
+    def yz(self):
+        return self._store.frame_points(self.index)
+
+    @yz.setter
+    def yz(self, yz):
+        self._store.set_frame_points(self.index, yz)
+
+    @property
+    def chines(self):
+        return self._store.frame_chines(self.index)
+
+    @chines.setter
+    def chines(self, chines):
+        self._store.set_frame_chines(self.index, chines)
+
+    @property
+    def revision(self):
+        return int(self._store.frame_revisions[self.index])
+
+    def touch(self):
+        """Mark the frame as modified"""
+        self._store.touch(self.index)
+
+    def scale(self, factor):
+        """Scale the frame in place
+
+        :param factor: Factor to scale y
+        """
+        self.yz *= factor
+        self.touch()
+
+    def offset(self, vector):
+        """Move the frame in the plane of the frame in place
+
+        :param vector: Vector (of size 2) to move by.
+        """
+        self.yz += np.asarray(vector)
+        self.touch()
+
+    def insert(self, index, yz, chine=False):
+        """Insert a point into the frame
+
+        :param index: Position in frame point list to insert at
+        :param yz: 2D coordinate of point to insert
+        :param chine: Whether the point represents a chine/is a kink point
+        """
+        self._store.insert_point(self.index, index, yz)
+        self.update_kinks(index, 1)
+        if chine:
+            self.add_kink(index)
+
+    def delete(self, index):
+        """Remove point at index
+
+        :param index: Index of point to delete
+        """
+        self._store.delete_point(self.index, index)
+        self.update_kinks(index, -1)
+
+    def __len__(self):
+        """Number of points in the frame"""
+        return int(self._store.counts[self.index])
+
+
+class PackedFrames(MutableSequence):
+    """List of frames packed into contiguous arrays
+
+    All frame points are stored in one float64 (N, 2) buffer. The points
+    of frame i are `points[offsets[i]:offsets[i + 1]]` and its chines are
+    `chines[chine_offsets[i]:chine_offsets[i + 1]]`. Items are
+    `PackedFrame` views on the buffers, so the hydrostatic functions can
+    work on the buffers directly. Assigning or inserting a frame copies its
+    data. Items don't survive changes of the order of the frames (see
+    `PackedFrame`) and read the store when used, so to swap frames copy both:
+    `p[i], p[j] = p[j].to_frame(), p[i].to_frame()`.
+
+    `revision` changes with every modification of the frames. Each frame
+    also has a revision in `frame_revisions`, which is unique among all
+    states of all frames of the store.
+    """
+
+    layout = 0  # Incremented when frames are inserted, deleted or reordered
+
+    def __init__(self, frames=()):
+        super().__init__()
+        if isinstance(frames, PackedFrames):
+            self._set_arrays(
+                frames.xs.copy(),
+                frames.points.copy(),
+                frames.offsets.copy(),
+                frames.chines.copy(),
+                frames.chine_offsets.copy(),
+            )
+            return
+        frames = list(frames)
+        xs = np.array([frame.x for frame in frames], dtype=float)
+        counts = [len(frame) for frame in frames]
+        if sum(counts):
+            points = np.concatenate(
+                [np.asarray(frame.yz, dtype=float).reshape(-1, 2) for frame in frames]
+            )
+        else:
+            points = np.zeros((0, 2))
+        chines = [list(frame.chines) for frame in frames]
+        self._set_arrays(
+            xs,
+            points,
+            _get_offsets(counts),
+            np.array([c for cs in chines for c in cs], dtype=int),
+            _get_offsets([len(cs) for cs in chines]),
+        )
+
+    @classmethod
+    def from_arrays(cls, xs, points, offsets, chines=None, chine_offsets=None):
+        """Create packed frames from existing arrays without copying
+
+        :param xs: X positions of the frames
+        :param points: (N, 2) array with the points of all frames
+        :param offsets: Start index of each frame in points, followed by N
+        :param chines: Chine indices of all frames. No chines when not provided
+        :param chine_offsets: Start index of each frame in chines, followed by the number of chines
+        :return: Packed frames
+        """
+        result = cls.__new__(cls)
+        xs = np.asarray(xs, dtype=float)
+        if chines is None:
+            chines = np.zeros(0, dtype=int)
+            chine_offsets = np.zeros(len(xs) + 1, dtype=int)
+        result._set_arrays(
+            xs,
+            np.asarray(points, dtype=float).reshape(-1, 2),
+            np.asarray(offsets, dtype=int),
+            np.asarray(chines, dtype=int),
+            np.asarray(chine_offsets, dtype=int),
+        )
+        return result
+
+    def _set_arrays(self, xs, points, offsets, chines, chine_offsets):
+        self.xs = xs
+        self.points = points
+        self.offsets = offsets
+        self.chines = chines
+        self.chine_offsets = chine_offsets
+        self.layout += 1
+        self.revision = 0
+        self.frame_revisions = np.arange(len(xs))
+        self._last_frame_revision = len(xs) - 1
+
+    @property
+    def counts(self):
+        """Number of points in each frame"""
+        return np.diff(self.offsets)
+
+    def touch(self, i=None):
+        """Mark the frames as modified
+
+        :param i: Index of the modified frame. All frames when not provided
+        """
+        self.revision += 1
+        if i is None:
+            count = len(self.xs)
+            self.frame_revisions = self._last_frame_revision + 1 + np.arange(count)
+            self._last_frame_revision += count
+        else:
+            self._last_frame_revision += 1
+            self.frame_revisions[i] = self._last_frame_revision
+
+    def tile(self, count):
+        """Get packed frames with all frames repeated count times
+
+        :param count: Number of repetitions
+        :return: New packed frames without chines
+        """
+        n = len(self.points)
+        offsets = (self.offsets[:-1] + n * np.arange(count)[:, None]).ravel()
+        return PackedFrames.from_arrays(
+            np.tile(self.xs, count),
+            np.tile(self.points, (count, 1)),
+            np.append(offsets, n * count),
+        )
+
+    @classmethod
+    def from_dense(cls, xs, points, chines=None):
+        """Create packed frames with the same number of points from dense arrays
+
+        :param xs: X positions of the frames
+        :param points: (frames, points, 2) array with the points of each frame
+        :param chines: (frames, chines) array with the chine indices of each frame.
+            No chines when not provided
+        :return: Packed frames with points viewing the dense array when possible
+        """
+        points = np.asarray(points, dtype=float)
+        frame_count, count = points.shape[:2]
+        chine_offsets = None
+        if chines is not None:
+            chines = np.asarray(chines, dtype=int).reshape(frame_count, -1)
+            chine_offsets = np.arange(frame_count + 1) * chines.shape[1]
+            chines = chines.reshape(-1)
+        return cls.from_arrays(
+            xs,
+            points.reshape(-1, 2),
+            np.arange(frame_count + 1) * count,
+            chines,
+            chine_offsets,
+        )
+
+    @property
+    def dense(self):
+        """(frames, points, 2) view on the points
+
+        Only available when all frames have the same number of points (see
+        `resample_frames`).
+        """
+        counts = self.counts
+        count = counts[0] if len(counts) else 0
+        if np.any(counts != count):
+            raise ValueError("frames have different numbers of points")
+        return self.points.reshape(len(self), count, 2)
+
+    def frame_points(self, i):
+        """Get (n, 2) view on the points of frame i"""
+        return self.points[self.offsets[i] : self.offsets[i + 1]]
+
+    def frame_chines(self, i):
+        """Get chine indices of frame i"""
+        return tuple(
+            int(c)
+            for c in self.chines[self.chine_offsets[i] : self.chine_offsets[i + 1]]
+        )
+
+    def set_frame_x(self, i, x):
+        """Set x position of frame i"""
+        self.xs[i] = x
+        self.touch(i)
+
+    def set_frame_points(self, i, yz):
+        """Replace the points of frame i"""
+        yz = np.array(yz, dtype=float).reshape(-1, 2)
+        start, end = self.offsets[i], self.offsets[i + 1]
+        if len(yz) == end - start:
+            self.points[start:end] = yz
+        else:
+            self.points = np.concatenate([self.points[:start], yz, self.points[end:]])
+            self.offsets[i + 1 :] += len(yz) - (end - start)
+        self.touch(i)
+
+    def set_frame_chines(self, i, chines):
+        """Replace the chine indices of frame i"""
+        chines = np.array(chines, dtype=int).reshape(-1)
+        start, end = self.chine_offsets[i], self.chine_offsets[i + 1]
+        self.chines = np.concatenate([self.chines[:start], chines, self.chines[end:]])
+        self.chine_offsets[i + 1 :] += len(chines) - (end - start)
+        self.touch(i)
+
+    def insert_point(self, i, index, yz):
+        """Insert a point in frame i at index (as `list.insert` does)"""
+        count = self.offsets[i + 1] - self.offsets[i]
+        index = min(max(index + count if index < 0 else index, 0), count)
+        self.points = np.insert(self.points, self.offsets[i] + index, yz, axis=0)
+        self.offsets[i + 1 :] += 1
+        self.touch(i)
+
+    def delete_point(self, i, index):
+        """Delete point at index from frame i (as `list.pop` does)"""
+        count = self.offsets[i + 1] - self.offsets[i]
+        if index < 0:
+            index += count
+        if not 0 <= index < count:
+            raise IndexError("point index out of range")
+        self.points = np.delete(self.points, self.offsets[i] + index, axis=0)
+        self.offsets[i + 1 :] -= 1
+        self.touch(i)
+
+    def __len__(self):
+        return len(self.xs)
+
+    def _get_index(self, i):
+        """Get non-negative frame index for index i, checking its range"""
+        if isinstance(i, slice):
+            raise TypeError("frames can only be assigned or deleted one at a time")
+        i = operator.index(i)
+        if i < 0:
+            i += len(self)
+        if not 0 <= i < len(self):
+            raise IndexError("frame index out of range")
+        return i
+
+    def __getitem__(self, i):
+        if isinstance(i, slice):
+            return [self[j] for j in range(*i.indices(len(self)))]
+        return PackedFrame(self, self._get_index(i))
+
+    def __setitem__(self, i, frame):
+        i = self._get_index(i)
+        x, yz, chines = frame.x, np.array(frame.yz, dtype=float), list(frame.chines)
+        self.set_frame_x(i, x)
+        self.set_frame_points(i, yz)
+        self.set_frame_chines(i, chines)
+
+    def __delitem__(self, i):
+        i = self._get_index(i)
+        self.set_frame_points(i, np.zeros((0, 2)))
+        self.set_frame_chines(i, [])
+        self.xs = np.delete(self.xs, i)
+        self.offsets = np.delete(self.offsets, i + 1)
+        self.chine_offsets = np.delete(self.chine_offsets, i + 1)
+        self.frame_revisions = np.delete(self.frame_revisions, i)
+        self.layout += 1
+
+    def insert(self, i, frame):
+        x, yz, chines = frame.x, np.array(frame.yz, dtype=float), list(frame.chines)
+        count = len(self)
+        i = min(max(i + count if i < 0 else i, 0), count)
+        self.xs = np.insert(self.xs, i, x)
+        self.frame_revisions = np.insert(self.frame_revisions, i, 0)
+        self.offsets = np.insert(self.offsets, i, self.offsets[i])
+        self.chine_offsets = np.insert(self.chine_offsets, i, self.chine_offsets[i])
+        self.layout += 1
+        self.set_frame_points(i, yz)
+        self.set_frame_chines(i, chines)
+
+    def pop(self, i=-1):
+        frame = self[i].to_frame()
+        del self[i]
+        return frame
+
+    def reverse(self):
+        counts = self.counts[::-1]
+        chine_counts = np.diff(self.chine_offsets)[::-1]
+        self.points = np.concatenate(
+            [self.frame_points(i) for i in reversed(range(len(self)))]
+            or [np.zeros((0, 2))]
+        )
+        self.chines = np.concatenate(
+            [
+                self.chines[self.chine_offsets[i] : self.chine_offsets[i + 1]]
+                for i in reversed(range(len(self)))
+            ]
+            or [np.zeros(0, dtype=int)]
+        )
+        self.xs = self.xs[::-1].copy()
+        self.offsets = _get_offsets(counts)
+        self.chine_offsets = _get_offsets(chine_counts)
+        self.frame_revisions = self.frame_revisions[::-1].copy()
+        self.layout += 1
+        self.revision += 1
+
+
+def _get_offsets(counts):
+    offsets = np.zeros(len(counts) + 1, dtype=int)
+    np.cumsum(counts, out=offsets[1:])
+    return offsets
+
+
+def pack_frames(frames):
+    """Get frames as `PackedFrames`
+
+    :param frames: List of frames
+    :return: The frames themselves when already packed, packed copy otherwise
+    """
+    if isinstance(frames, PackedFrames):
+        return frames
+    return PackedFrames(frames)
+
+
 class Vertical(Kinked):
     """Vertical section of lines plan"""
 
@@ -215,28 +683,54 @@ class Lines:
     deck_line: Line = None
     chines: list[Line] = None
 
+    cache = None
+    _incremental = None
+
     def __init__(self, *args, **kwargs):
         super().__init__()
         self.frames = []
         self.name = ""
+        self._revision = 0
+
+    @property
+    def revision(self):
+        """Revision of the plan
+
+        Changes with every modification through the methods of the plan and
+        its frames.
+        """
+        if isinstance(self.frames, PackedFrames):
+            frames = self.frames.revision
+        else:
+            frames = tuple((id(frame), frame.revision) for frame in self.frames)
+        return self._revision, id(self.frames), len(self.frames), frames
+
+    def touch(self):
+        """Mark the plan as modified"""
+        self._revision += 1
 
     def close_frames(self, margin=5e-3):
         """Close frames that have an open top (i.e. no deck)
 
         :param margin: Threshold y value of last frame point to consider it being on the center line
         """
+        self.touch()
         for frame in self.frames:
             if frame.yz[0][0] < margin:
-                frame.yz[0][0] = 0.0
+                if frame.yz[0][0] != 0.0:
+                    frame.yz[0][0] = 0.0
+                    frame.touch()
             else:
-                frame.chines.insert(0, 1)
-                frame.yz.insert(0, [0.0, frame.yz[0][1]])
+                frame.insert(0, [0.0, frame.yz[0][1]])
+                frame.add_kink(1)
 
             if frame.yz[-1][0] < margin:
-                frame.yz[-1][0] = 0.0
+                if frame.yz[-1][0] != 0.0:
+                    frame.yz[-1][0] = 0.0
+                    frame.touch()
             else:
-                frame.chines.append(len(frame.yz) - 1)
-                frame.yz.append([0.0, frame.yz[-1][1]])
+                frame.add_kink(len(frame) - 1)
+                frame.insert(len(frame), [0.0, frame.yz[-1][1]])
 
     def scale(self, factor):
         """Scale all frames
@@ -246,128 +740,470 @@ class Lines:
         for frame in self.frames:
             frame.scale(factor)
 
-    def save(self, filename):
+    @property
+    def packed(self):
+        """Whether the frames are stored in packed form"""
+        return isinstance(self.frames, PackedFrames)
+
+    def pack(self):
+        """Store the frames in packed form (see `PackedFrames`)"""
+        self.frames = pack_frames(self.frames)
+
+    def save(self, filename, binary=False):
         """Save the lines to disk
 
         :param filename: Filename to save to
+        :param binary: Whether to save in binary format (see `save_lines_plan`)
+        """
+        save_lines_plan(self, filename, binary)
+
+    @property
+    def incremental(self):
+        """Incremental hydrostatics of the frames (see `IncrementalHydrostatics`)"""
+        if self._incremental is None or self._incremental.frames is not self.frames:
+            self._incremental = IncrementalHydrostatics(self.frames)
+        return self._incremental
+
+    def enable_cache(self, maxsize=128):
+        """Cache results of hydrostatic queries on the plan
+
+        :param maxsize: Maximum number of results to keep
+        """
+        self.cache = HydrostaticsCache(maxsize)
+
+    def disable_cache(self):
+        """Stop caching results of hydrostatic queries"""
+        self.cache = None
+
+    def evaluate(self, function, *args, **kwargs):
+        """Evaluate hydrostatic function on the frames of the plan
+
+        Results are taken from the cache when it is enabled. The cache is
+        cleared when the plan is modified (see `revision`).
+
+        :param function: Function taking the frames as first argument
+        :param args: Further (hashable) arguments of the function
+        :param kwargs: Further (hashable) keyword arguments of the function
+        :return: Result of the function
+        """
+        if self.cache is None:
+            return function(self.frames, *args, **kwargs)
+        key = (self.revision, function, args, tuple(sorted(kwargs.items())))
+        return self.cache.get(key, lambda: function(self.frames, *args, **kwargs))
+
+    def get_displacement(self, draft_ap, draft_fp=None):
+        """Get displacement (see module function `get_displacement`)"""
+        return self.evaluate(get_displacement, *_get_drafts(draft_ap, draft_fp))
+
+    def get_lcb(self, draft_ap, draft_fp=None):
+        """Get LCB (see module function `get_lcb`)"""
+        return self.evaluate(get_lcb, *_get_drafts(draft_ap, draft_fp))
+
+    def get_kb(self, draft_ap, draft_fp=None, method="moments"):
+        """Get KB (see module function `get_kb`)"""
+        drafts = _get_drafts(draft_ap, draft_fp)
+        return self.evaluate(get_kb, *drafts, method=method)
+
+    def get_bm(self, draft_ap, draft_fp=None):
+        """Get BM (see module function `get_bm`)"""
+        return self.evaluate(get_bm, *_get_drafts(draft_ap, draft_fp))
+
+    def get_km(self, draft_ap, draft_fp=None):
+        """Get KM (see module function `get_km`)"""
+        return self.evaluate(get_km, *_get_drafts(draft_ap, draft_fp))
+
+    def get_lcf(self, draft_ap, draft_fp=None):
+        """Get LCF (see module function `get_lcf`)"""
+        return self.evaluate(get_lcf, *_get_drafts(draft_ap, draft_fp))
+
+    def get_wetted_surface(self, draft_ap, draft_fp=None):
+        """Get wetted surface (see module function `get_wetted_surface`)"""
+        return self.evaluate(get_wetted_surface, *_get_drafts(draft_ap, draft_fp))
+
+
+def _get_drafts(draft_ap, draft_fp):
+    return draft_ap, draft_ap if draft_fp is None else draft_fp
+
+
+class HydrostaticsCache:
+    """Least recently used cache of hydrostatic query results"""
+
+    def __init__(self, maxsize=128):
+        """Create empty cache
+
+        :param maxsize: Maximum number of results to keep
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._results = OrderedDict()
+        self._revision = None
+
+    def __len__(self):
+        return len(self._results)
+
+    def get(self, key, compute):
+        """Get cached result or compute and cache it
+
+        :param key: Tuple of plan revision and query. Results for other
+            revisions are dropped.
+        :param compute: Function to compute the result when it is not cached
+        :return: Result
         """
-        save_lines_plan(self, filename)
+        if key[0] != self._revision:
+            self._results.clear()
+            self._revision = key[0]
+        if key in self._results:
+            self.hits += 1
+            self._results.move_to_end(key)
+            return self._results[key]
+        self.misses += 1
+        result = compute()
+        self._results[key] = result
+        if len(self._results) > self.maxsize:
+            self._results.popitem(last=False)
+        return result
+
+    def clear(self):
+        """Drop all cached results"""
+        self._results.clear()
+
+    def info(self):
+        """Get cache statistics
+
+        :return: Dictionary with hits, misses, size and maxsize
+        """
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "size": len(self._results),
+            "maxsize": self.maxsize,
+        }
+
+
+# Binary format: header with magic, version, name length and numbers of
+# frames, points and chines, followed by the name and the arrays xs,
+# offsets, chine_offsets, chines and points, each aligned to 8 bytes
+BINARY_MAGIC = b"LINESPLN"
+BINARY_VERSION = 1
+_binary_header = struct.Struct("<8sIIqqq")
 
 
-def load_lines_plan(filename):
+def load_lines_plan(filename, packed=None):
     """Load lines plan from file
 
+    The format (JSON or binary, see `save_lines_plan`) is detected from the
+    contents of the file. Binary files are memory mapped, so frame points are
+    only read from disk when they are accessed. Modifications of the frames
+    are not written back to the file.
+
     :param filename: Filename of lines in dedicated file format
+    :param packed: Whether to store the frames in packed form. By default,
+        frames of binary files are packed and those of JSON files aren't.
     """
+    with open(filename, "rb") as f:
+        binary = f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    if binary:
+        result = _load_binary_lines_plan(filename)
+        if packed is False:
+            frames = []
+            for packed_frame in result.frames:
+                frame = Frame(packed_frame.yz.tolist(), x=packed_frame.x)
+                frame.chines = list(packed_frame.chines)
+                frames.append(frame)
+            result.frames = frames
+        return result
     result = Lines()
-    with open(filename) as f:
-        data = json.loads(f.read())
-        result.name = data["name"]
-        for f in data["frames"]:
-            frame = Frame()
-            frame.x = f["x"]
-            frame.yz = f["yz"]
-            if "chines" in f:
-                frame.chines = f["chines"]
-            result.frames.append(frame)
+    with LinesPlanReader(filename) as reader:
+        result.frames = list(reader)
+        result.name = reader.name
+    if packed:
+        result.pack()
     return result
 
 
-def save_lines_plan(lines, filename):
+def _load_binary_lines_plan(filename):
+    buffer = np.memmap(filename, dtype=np.uint8, mode="c")
+    magic, version, name_length, frame_count, point_count, chine_count = (
+        _binary_header.unpack_from(buffer)
+    )
+    if version != BINARY_VERSION:
+        raise ValueError(f"Unsupported lines plan version: {version}")
+    position = _binary_header.size
+    name = bytes(buffer[position : position + name_length]).decode("utf-8")
+    position += name_length
+
+    def read(dtype, count):
+        nonlocal position
+        position += -position % 8
+        size = np.dtype(dtype).itemsize * count
+        array = buffer[position : position + size].view(dtype)
+        position += size
+        return array
+
+    xs = read("<f8", frame_count)
+    offsets = read("<i8", frame_count + 1)
+    chine_offsets = read("<i8", frame_count + 1)
+    chines = read("<i8", chine_count)
+    points = read("<f8", 2 * point_count).reshape(point_count, 2)
+    result = Lines()
+    result.name = name
+    result.frames = PackedFrames.from_arrays(xs, points, offsets, chines, chine_offsets)
+    return result
+
+
+def save_lines_plan(lines, filename, binary=False):
     """Save linesplan to file in dedicated format
 
     :param filename: Filename to save the lines to
+    :param binary: Whether to save in binary format rather than JSON. Binary
+        files are smaller and faster to load.
     """
-    frames = [{"x": fr.x, "yz": fr.yz, "chines": fr.chines} for fr in lines.frames]
-    s = json.dumps({"name": lines.name, "frames": frames}, indent=2)
-    with open(filename, "w") as f:
-        f.write(s)
-
-
-def plot_frames(
-    frames,
-    title=None,
-    show_legend=False,
-    show_waterline=None,
-    filename=None,
-    ylim=None,
-    xlim=None,
-    cb=None,
-):
-    """Plot frames of lines plan using matplotlib
-
-    :param frames: List of frames. Typically `Lines.frames`
-    :param title: Title of plot
-    :param show_legend: Whether to show a legend on the plot
-    :param show_waterline: Show waterline a z level indicated by the value of this parameter
-    :param filename: Filename to plot to rather than show on screen
-    :param ylim: Y limits of plot range (z range of plan)
-    :param xlim: X limits of plot range (y range of plan)
-    :param cb: Plot center of buoyance at this location (3D point)
-    """
-    plt.clf()
-    if title:
-        plt.title(title)
-    for i, frame in enumerate(frames):
-        a = np.asarray(frame.yz)
-        plt.plot(a.T[0, :], a.T[1, :], label=str(i))
-    if show_legend:
-        plt.legend()
-    if show_waterline is not None:
-        plt.axhline(y=show_waterline, color="b")
-    if cb is not None:
-        plt.scatter(cb[1], cb[2], marker="o", s=10, c="#000000")
-        plt.axvline(x=cb[1], color="black", linestyle="--", linewidth=1)
-    plt.axis("equal")
-    if ylim is not None:
-        plt.ylim(*ylim)
-    if xlim is not None:
-        plt.xlim(*xlim)
-    if filename is None:
-        plt.show()
-    else:
-        plt.savefig("%s.png" % filename)
+    if binary:
+        _save_binary_lines_plan(lines, filename)
+        return
+    with LinesPlanWriter(filename, lines.name) as writer:
+        for frame in lines.frames:
+            writer.write(frame)
+
+
+def _save_binary_lines_plan(lines, filename):
+    # The frames may be mapped from filename itself, so the plan is written to
+    # a temporary file that replaces filename when complete
+    frames = pack_frames(lines.frames)
+    name = lines.name.encode("utf-8")
+    header = _binary_header.pack(
+        BINARY_MAGIC,
+        BINARY_VERSION,
+        len(name),
+        len(frames),
+        len(frames.points),
+        len(frames.chines),
+    )
+    fd, temporary = _create_temporary(filename)
+    try:
+        with open(fd, "wb") as f:
+            f.write(header)
+            f.write(name)
+            for array, dtype in (
+                (frames.xs, "<f8"),
+                (frames.offsets, "<i8"),
+                (frames.chine_offsets, "<i8"),
+                (frames.chines, "<i8"),
+                (frames.points, "<f8"),
+            ):
+                f.write(bytes(-f.tell() % 8))
+                f.write(np.ascontiguousarray(array, dtype=dtype).tobytes())
+        os.replace(temporary, filename)
+    except BaseException:
+        os.unlink(temporary)
+        raise
+
+
+def _create_temporary(filename):
+    """Create temporary file in the directory of filename to replace it with
+
+    :return: Tuple of file descriptor and name of the temporary file
+    """
+    directory = os.path.dirname(os.path.abspath(filename))
+    fd, temporary = tempfile.mkstemp(dir=directory, suffix=".tmp")
+    # Give the file the permissions of a newly created one
+    umask = os.umask(0)
+    os.umask(umask)
+    os.chmod(temporary, 0o666 & ~umask)
+    return fd, temporary
 
 
-def plot_waterlines(
-    frames,
-    drafts_ap,
-    drafts_fp=None,
-    title=None,
-    show_frames=False,
-    show_legend=False,
-    filename=None,
-):
-    """Plot waterlines
-
-    Interpolate waterlines from frame data and plot using matplotlib
-    :param frames: List of frames (Typically `Lines.frames`)
-    :param drafts_ap: List of drafs levels at aft perpendicular to draw waterlines at
-    :param drafts_fp: List of drafs levels at forward perpendicular. Assumed equal to `drafts_ap` when not provided
-    :param title: Plot title
-    :param show_frames: Whether to show the frame locations
-    :param show_legend: Whether to show plot legend
-    :param filename: Filename to save plot to rather than show it on the screen
-    """
-    plt.clf()
-    if title:
-        plt.title(title)
-    waterlines = get_waterlines(frames, drafts_ap, drafts_fp)
-    for i, waterline in enumerate(waterlines):
-        if not waterline:
-            continue
-        waterline = np.asarray(waterline)
-        plt.plot(waterline.T[0, :], waterline.T[1, :], label=str(i))
-    if show_frames:
-        i = 0
-        for x, y, z in waterlines[-1]:
-            plt.plot([x, x], [0, y], label=str(i))
-            i += 1
-    plt.axis("equal")
-    if filename is None:
-        plt.show()
-    else:
-        plt.savefig("%s.png" % filename)
+class LinesPlanReader:
+    """Reader of JSON lines plans that yields the frames one at a time
+
+    Only the frame being decoded is kept in memory, so plans of any size
+    can be processed. Use as context manager:
+
+        with LinesPlanReader(filename) as reader:
+            for frame in reader:
+                ...
+
+    The name of the plan is available as `name` once it has been read,
+    which is before the first frame for files written by `save_lines_plan`.
+    """
+
+    def __init__(self, filename, chunk_size=1 << 16):
+        """Open lines plan
+
+        :param filename: Filename of lines plan in JSON format
+        :param chunk_size: Number of characters to read from the file at once
+        """
+        self.name = ""
+        self.chunk_size = chunk_size
+        self._file = open(filename)
+        self._decoder = json.JSONDecoder()
+        self._buffer = ""
+        self._position = 0
+        self._eof = False
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        self.close()
+
+    def close(self):
+        """Close the file"""
+        self._file.close()
+
+    def _fill(self):
+        """Read next chunk, dropping the consumed part of the buffer"""
+        buffer = self._buffer[self._position :]
+        # Grow with the unconsumed part to keep decoding of large frames linear
+        chunk = self._file.read(max(self.chunk_size, len(buffer)))
+        self._eof = not chunk
+        self._buffer = buffer + chunk
+        self._position = 0
+        return not self._eof
+
+    def _next_char(self):
+        """Skip white space and get next character without consuming it"""
+        while True:
+            buffer = self._buffer
+            while self._position < len(buffer) and buffer[self._position] in " \t\n\r":
+                self._position += 1
+            if self._position < len(buffer):
+                return buffer[self._position]
+            if not self._fill():
+                raise ValueError("Unexpected end of lines plan")
+
+    def _expect(self, chars):
+        char = self._next_char()
+        if char not in chars:
+            raise ValueError(f"Expected one of {chars!r} in lines plan, got {char!r}")
+        self._position += 1
+        return char
+
+    def _decode(self):
+        """Decode next JSON value, reading more of the file as needed"""
+        self._next_char()
+        while True:
+            try:
+                value, end = self._decoder.raw_decode(self._buffer, self._position)
+            except json.JSONDecodeError:
+                if not self._fill():
+                    raise
+                continue
+            # A number at the end of the buffer may continue in the next chunk
+            if end == len(self._buffer) and self._fill():
+                continue
+            self._position = end
+            return value
+
+    def __iter__(self):
+        """Yield the frames of the plan
+
+        :return: Generator of `Frame`
+        """
+        self._expect("{")
+        if self._next_char() == "}":
+            return
+        while True:
+            key = self._decode()
+            self._expect(":")
+            if key == "frames":
+                yield from self._frames()
+            else:
+                value = self._decode()
+                if key == "name":
+                    self.name = value
+            if self._expect(",}") == "}":
+                return
+
+    def _frames(self):
+        self._expect("[")
+        if self._next_char() == "]":
+            self._position += 1
+            return
+        while True:
+            data = self._decode()
+            frame = Frame()
+            frame.x = data["x"]
+            frame.yz = data["yz"]
+            if "chines" in data:
+                frame.chines = data["chines"]
+            yield frame
+            if self._expect(",]") == "]":
+                return
+
+
+class LinesPlanWriter:
+    """Writer of JSON lines plans that writes the frames one at a time
+
+    The output is the same as that of `save_lines_plan`. Use as context
+    manager:
+
+        with LinesPlanWriter(filename, name) as writer:
+            for frame in frames:
+                writer.write(frame)
+
+    The frames are written to a temporary file, which replaces filename on
+    `close`. When the context is left by an exception, the temporary file is
+    removed and filename is left as it was.
+    """
+
+    def __init__(self, filename, name=""):
+        """Create lines plan file
+
+        :param filename: Filename to save the lines to
+        :param name: Name of the lines plan
+        """
+        self._filename = filename
+        fd, self._temporary = _create_temporary(filename)
+        self._file = open(fd, "w")
+        self._file.write(f'{{\n  "name": {json.dumps(name)},\n  "frames": [')
+        self._count = 0
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        if exc_type is None:
+            self.close()
+        else:
+            self.abort()
+
+    def write(self, frame):
+        """Write frame to the file
+
+        :param frame: Frame to write
+        """
+        data = {"x": frame.x, "yz": _as_list(frame.yz), "chines": list(frame.chines)}
+        lines = json.dumps(data, indent=2).split("\n")
+        self._file.write(",\n" if self._count else "\n")
+        self._file.write("\n".join("    " + line for line in lines))
+        self._count += 1
+
+    def close(self):
+        """Finish the file and move it to filename"""
+        if self._file.closed:
+            return
+        try:
+            self._file.write("\n  ]\n}" if self._count else "]\n}")
+            self._file.close()
+            os.replace(self._temporary, self._filename)
+        except BaseException:
+            self.abort()
+            raise
+
+    def abort(self):
+        """Close and remove the unfinished file, leaving filename as it was"""
+        if not self._file.closed:
+            self._file.close()
+        if os.path.exists(self._temporary):
+            os.unlink(self._temporary)
+
+
+def _as_list(yz):
+    if isinstance(yz, np.ndarray):
+        return yz.tolist()
+    return yz
 
 
 def line_segments(line):
@@ -447,6 +1283,85 @@ def get_submerged_frame(frame, draft):
     return result
 
 
+def get_frame_drafts(xs, draft_ap, draft_fp=None):
+    """Get draft at each frame position
+
+    :param xs: X positions of the frames
+    :param draft_ap: Draft at aft perpendicular
+    :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
+    :return: Array of drafts
+    """
+    if draft_fp is None:
+        draft_fp = draft_ap
+    return xs / (xs[-1] - xs[0]) * (draft_fp - draft_ap) + draft_ap
+
+
+@profiled
+def get_submerged_sections(frames, drafts):
+    """Get submerged parts of all frames in one pass
+
+    Vectorized equivalent of calling `get_submerged_frame` for each frame
+
+    :param frames: List of frames
+    :param drafts: Draft level for each frame
+    :return: Packed submerged parts of frames
+    """
+    frames = pack_frames(frames)
+    a = frames.points
+    counts = frames.counts
+    drafts = np.repeat(np.asarray(drafts, dtype=float), counts)
+    # Previous point in the same frame. The first point of a frame is its own
+    # predecessor, so it can't cross the waterline
+    prev = np.empty_like(a)
+    prev[1:] = a[:-1]
+    starts = frames.offsets[:-1][counts > 0]
+    prev[starts] = a[starts]
+    prev_sub = drafts - prev[:, 1]
+    new_sub = drafts - a[:, 1]
+    crossing = prev_sub * new_sub < 0
+    keep = new_sub >= 0
+    # Each point contributes a waterline crossing and/or itself
+    out_counts = crossing.astype(int) + keep
+    positions = np.cumsum(out_counts) - out_counts
+    result = np.empty((positions[-1] + out_counts[-1] if len(a) else 0, 2))
+    i = np.nonzero(crossing)[0]
+    dz = a[i, 1] - prev[i, 1]
+    dy = a[i, 0] - prev[i, 0]
+    result[positions[i], 0] = prev[i, 0] + prev_sub[i] / dz * dy
+    result[positions[i], 1] = drafts[i]
+    i = np.nonzero(keep)[0]
+    result[positions[i] + crossing[i]] = a[i]
+    offsets = np.concatenate([[0], np.cumsum(out_counts)])[frames.offsets]
+    return PackedFrames.from_arrays(frames.xs.copy(), result, offsets)
+
+
+@profiled
+def get_waterline_breadths(frames, drafts):
+    """Get breadth of each frame at its waterline
+
+    The breadth is the rate of change of the submerged sectional area with
+    draft, so for half frames this is the half breadth.
+
+    :param frames: List of frames
+    :param drafts: Draft level for each frame
+    :return: Array of breadths
+    """
+    frames = pack_frames(frames)
+    a = frames.points
+    counts = frames.counts
+    drafts = np.repeat(np.asarray(drafts, dtype=float), counts)
+    prev = np.empty_like(a)
+    prev[1:] = a[:-1]
+    starts = frames.offsets[:-1][counts > 0]
+    prev[starts] = a[starts]
+    prev_sub = drafts - prev[:, 1]
+    i = np.nonzero(prev_sub * (drafts - a[:, 1]) < 0)[0]
+    dz = a[i, 1] - prev[i, 1]
+    ys = prev[i, 0] + prev_sub[i] / dz * (a[i, 0] - prev[i, 0])
+    frame_indices = np.repeat(np.arange(len(frames)), counts)[i]
+    return np.bincount(frame_indices, np.sign(dz) * ys, minlength=len(frames))
+
+
 def get_cross_section(frame, full=False):
     """Get sectional area of frame
 
@@ -489,21 +1404,97 @@ def get_mom_z(frame):
     return np.sum(dz * yz) / 6.0
 
 
+def _frame_sums(offsets, values):
+    """Sum per segment values over the segments of each packed line
+
+    :param offsets: Start index of each line in the point buffer, followed by its length
+    :param values: Value for each pair of consecutive points in the buffer
+    :return: Array with the sum for each line
+    """
+    starts = offsets[:-1]
+    if not len(values):
+        return np.zeros(len(starts))
+    # Drop the segments that join the last point of a line to the next line
+    ends = offsets[1:-1] - 1
+    values[ends[(ends >= 0) & (ends < len(values))]] = 0.0
+    values = np.append(values, 0.0)
+    result = np.add.reduceat(values, np.minimum(starts, len(values) - 1))
+    result[np.diff(offsets) < 2] = 0.0
+    return result
+
+
+@profiled
+def get_cross_sections(frames, full=False):
+    """Get sectional areas of all frames
+
+    :param frames: List of frames
+    :param full: Wether to consider only the full frame or only half
+    :return: Array of sectional areas
+    """
+    packed = pack_frames(frames)
+    a = packed.points
+    values = (a[1:, 1] - a[:-1, 1]) * (a[1:, 0] + a[:-1, 0]) / 2.0
+    return _frame_sums(packed.offsets, values) * (2 - full)
+
+
+@profiled
+def get_mom_ys(frames):
+    """Get static area moments about Y axis of all frames
+
+    :param frames: List of frames
+    :return: Array of moments (see `get_mom_y`)
+    """
+    packed = pack_frames(frames)
+    a = packed.points
+    dz = a[1:, 1] - a[:-1, 1]
+    yy = a[:-1, 0] ** 2 + a[:-1, 0] * a[1:, 0] + a[1:, 0] ** 2
+    return _frame_sums(packed.offsets, dz * yy / 6.0)
+
+
+@profiled
+def get_mom_zs(frames):
+    """Get static area moments about Z axis of all frames
+
+    :param frames: List of frames
+    :return: Array of moments (see `get_mom_z`)
+    """
+    packed = pack_frames(frames)
+    a = packed.points
+    dz = a[1:, 1] - a[:-1, 1]
+    yz = 2 * (a[:-1, 1] * a[:-1, 0] + a[1:, 1] * a[1:, 0]) + (
+        a[:-1, 1] * a[1:, 0] + a[1:, 1] * a[:-1, 0]
+    )
+    return _frame_sums(packed.offsets, dz * yz / 6.0)
+
+
+@profiled
+def get_girths(frames):
+    """Get length along the points of all frames
+
+    :param frames: List of frames
+    :return: Array of girths
+    """
+    packed = pack_frames(frames)
+    a = packed.points
+    segments = a[1:] - a[:-1]
+    return _frame_sums(packed.offsets, np.hypot(segments[:, 0], segments[:, 1]))
+
+
+@profiled
 def get_submerged_frames(frames, draft_ap, draft_fp=None):
     """Get list of submerged parts of frames
 
     :param frames: List of frames
     :param draft_ap: Draft at aft perpendicular
     :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
-    :return: List of submerged parts of frames
+    :return: Packed submerged parts of frames
     """
-    if draft_fp is None:
-        draft_fp = draft_ap
-    xs = np.array([frame.x for frame in frames])
-    drafts = xs / (xs[-1] - xs[0]) * (draft_fp - draft_ap) + draft_ap
-    return [get_submerged_frame(frame, draft) for frame, draft in zip(frames, drafts)]
+    frames = pack_frames(frames)
+    drafts = get_frame_drafts(frames.xs, draft_ap, draft_fp)
+    return get_submerged_sections(frames, drafts)
 
 
+@profiled
 def get_displacement(frames, draft_ap, draft_fp=None, full=False):
     """Get displacement at specified draft
 
@@ -512,15 +1503,14 @@ def get_displacement(frames, draft_ap, draft_fp=None, full=False):
     :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
     :return: DISP
     """
+    frames = pack_frames(frames)
     submerged_frames = get_submerged_frames(frames, draft_ap, draft_fp)
-    xs = np.array([frame.x for frame in frames])
-    cross_sections = [
-        get_cross_section(submerged, full) for submerged in submerged_frames
-    ]
-    disp = simpson(cross_sections, x=xs)
+    cross_sections = get_cross_sections(submerged_frames, full)
+    disp = simpson(cross_sections, x=frames.xs)
     return disp
 
 
+@profiled
 def get_lcb(frames, draft_ap, draft_fp=None):
     """Get longitudinal position of center of buoyancy
 
@@ -529,14 +1519,16 @@ def get_lcb(frames, draft_ap, draft_fp=None):
     :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
     :return: LCB
     """
+    frames = pack_frames(frames)
     submerged_frames = get_submerged_frames(frames, draft_ap, draft_fp)
-    xs = np.array([frame.x for frame in frames])
-    cross_sections = [get_cross_section(submerged) for submerged in submerged_frames]
+    xs = frames.xs
+    cross_sections = get_cross_sections(submerged_frames)
     disp = simpson(cross_sections, x=xs)
     mom = simpson(cross_sections * xs, x=xs)
     return mom / disp
 
 
+@profiled
 def get_waterline(frames, draft_ap, draft_fp=None):
     """Get waterline at specified draft
 
@@ -545,63 +1537,153 @@ def get_waterline(frames, draft_ap, draft_fp=None):
     :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
     :return: Waterline
     """
-    result = []
     if draft_fp is None:
         draft_fp = draft_ap
-    xs = np.array([frame.x for frame in frames])
-    drafts = xs / (xs[-1] - xs[0]) * (draft_fp - draft_ap) + draft_ap
-    waterline_points_list = [
-        (frame.x, get_waterline_points(frame, draft))
-        for frame, draft in zip(frames, drafts)
+    return get_waterline_arrays(frames, [draft_ap], [draft_fp])[0].tolist()
+
+
+@profiled
+def get_waterline_arrays(frames, drafts_ap, drafts_fp=None):
+    """Get waterlines for many drafts as arrays
+
+    The waterline crossings of all frames are found for all drafts in one
+    pass. Each waterline then follows the same path as `get_waterline`:
+    from the bow to the stern along the last crossing of each frame and
+    back along the next to last crossings until a frame runs out of
+    crossings.
+
+    :param frames: List of half frames
+    :param drafts_ap: List of drafts at aft perpendicular
+    :param drafts_fp: List of drafts at forward perpendicular. Same as drafts_ap when not provided
+    :return: List of (n, 3) arrays with x, y, z of the waterline points
+    """
+    frames = pack_frames(frames)
+    drafts_ap = np.atleast_1d(np.asarray(drafts_ap, dtype=float))
+    if drafts_fp is None:
+        drafts_fp = drafts_ap
+    drafts_fp = np.broadcast_to(np.asarray(drafts_fp, dtype=float), drafts_ap.shape)
+    drafts = get_frame_drafts(frames.xs, drafts_ap[:, None], drafts_fp[:, None])
+    conditions, crossing_frames, crossings = get_waterline_crossings(frames, drafts)
+    condition_offsets = np.searchsorted(conditions, np.arange(len(drafts_ap) + 1))
+    return [
+        _get_waterline_path(
+            crossings[start:end], crossing_frames[start:end], len(frames)
+        )
+        for start, end in zip(condition_offsets[:-1], condition_offsets[1:])
     ]
-    # Pop empty items from front and back (frames not touching the waterline)
-    while waterline_points_list and not waterline_points_list[-1][1]:
-        waterline_points_list.pop(-1)
-    while waterline_points_list and not waterline_points_list[0][1]:
-        waterline_points_list.pop(0)
-
-    direction = -1
-    # Start at the bow
-    i = len(waterline_points_list)
-    if i < 2:
-        # If there are fewer than 2 points, there is no line
-        return result
-    while True:
-        i += direction
-        if i < 0 or i == len(waterline_points_list):
-            direction = -direction
-            i += 2 * direction
-
-        waterline_points = waterline_points_list[i]
-        if not waterline_points[1]:
-            break
-        p = waterline_points[1].pop(-1)
-        result.append([waterline_points[0], p[0], p[1]])
-    result.reverse()
-    return result
 
 
+@profiled
+def get_waterline_crossings(frames, drafts):
+    """Get crossings of all frames with waterlines
+
+    Like `get_waterline_points`, each frame starts from the origin.
+
+    :param frames: List of half frames
+    :param drafts: (n, m) array with the draft at each of the m frames for n waterlines
+    :return: Tuple of the waterline index and the frame index of each crossing
+        and (k, 3) array with x, y, z of the crossings. Crossings are ordered by
+        waterline, frame and point.
+    """
+    frames = pack_frames(frames)
+    xs = frames.xs
+    a = frames.points
+    counts = frames.counts
+    frame_indices = np.repeat(np.arange(len(frames)), counts)
+    prev = np.empty_like(a)
+    prev[1:] = a[:-1]
+    prev[frames.offsets[:-1][counts > 0]] = 0.0
+    point_drafts = drafts[:, frame_indices]
+    prev_sub = point_drafts - prev[:, 1]
+    conditions, points = np.nonzero(prev_sub * (point_drafts - a[:, 1]) < 0)
+    prev_sub = prev_sub[conditions, points]
+    prev = prev[points]
+    ys = prev[:, 0] + prev_sub / (a[points, 1] - prev[:, 1]) * (
+        a[points, 0] - prev[:, 0]
+    )
+    crossing_frames = frame_indices[points]
+    crossings = np.stack(
+        [xs[crossing_frames], ys, point_drafts[conditions, points]], axis=1
+    )
+    return conditions, crossing_frames, crossings
+
+
+def _get_waterline_path(crossings, crossing_frames, frame_count):
+    frame_crossings = np.bincount(crossing_frames, minlength=frame_count)
+    touching = np.nonzero(frame_crossings)[0]
+    if len(touching) < 1 or touching[-1] - touching[0] < 1:
+        # If there are fewer than 2 frames, there is no line
+        return np.zeros((0, 3))
+    first = touching[0]
+    c = frame_crossings[first : touching[-1] + 1]
+    crossing_starts = np.cumsum(c) - c
+    n = len(c)
+    period = 2 * (n - 1)
+    # The path visits the frames in a triangle wave starting at the bow.
+    # Frame g is visited at times n - 1 - g and n - 1 + g modulo the
+    # period. The path ends at the first visit to an exhausted frame.
+    g = np.arange(n)
+    inner = (g > 0) & (g < n - 1)
+    visit = np.where(
+        inner,
+        c // 2 * period + np.where(c % 2, n - 1 + g, n - 1 - g),
+        c * period + (n - 1 - g) % period,
+    )
+    t = np.arange(visit.min())
+    s = t % period
+    g = np.where(s <= n - 1, n - 1 - s, s - (n - 1))
+    k = np.where(inner[g], 2 * (t // period) + (s > n - 1), t // period)
+    return crossings[crossing_starts[g] + c[g] - 1 - k][::-1]
+
+
+@profiled(points=None)
 def get_waterline_properties(waterline):
     """Get properties of waterline
 
     :param waterline: Waterline to consider
     :return: Area, Static moment X, Squared moment X, Static moment Y, Squared moment Y
     """
-    area, momx, momx2, momy, momy2 = 0.0, 0.0, 0.0, 0.0, 0.0
-    for p1, p2 in zip(waterline[:-1], waterline[1:]):
-        x1, x2, y1, y2 = p1[0], p2[0], p1[1], p2[1]
-        area += (x2 - x1) * (y1 + y2) / 2.0
-        momx += (x2 - x1) * (y1**2 + y1 * y2 + y2**2) / 6.0
-        momx2 += (x2 - x1) * (y1**3 + y1 * y2**2 + y1**2 * y2 + y2**3) / 12.0
-        momy += (x2 - x1) * (2 * (x1 * y1 + x2 * y2) + (x1 * y2 + x2 * y1)) / 6.0
-        momy2 += (
-            (x2 - x1)
-            * (
-                y1 * (3 * x1**2 + 1 * x2**2 + 2 * x1 * x2)
-                + y2 * (1 * x1**2 + 3 * x2**2 + 2 * x1 * x2)
-            )
-            / 12.0
+    waterline = np.asarray(waterline, dtype=float)
+    if len(waterline) < 2:
+        return 0.0, 0.0, 0.0, 0.0, 0.0
+    return tuple(float(np.sum(p)) for p in _waterline_segment_properties(waterline))
+
+
+@profiled(points=None)
+def get_waterlines_properties(waterlines):
+    """Get properties of many waterlines
+
+    :param waterlines: List of waterlines or (n, m, 3) array of waterlines
+        padded with NaN rows
+    :return: Arrays of Area, Static moment X, Squared moment X, Static moment Y,
+        Squared moment Y
+    """
+    if isinstance(waterlines, np.ndarray) and waterlines.ndim == 3:
+        waterlines = [w[~np.isnan(w).any(axis=1)] for w in waterlines]
+    waterlines = [np.asarray(w, dtype=float).reshape(-1, 3) for w in waterlines]
+    offsets = _get_offsets([len(w) for w in waterlines])
+    if not offsets[-1]:
+        return tuple(np.zeros(len(waterlines)) for _ in range(5))
+    properties = _waterline_segment_properties(np.concatenate(waterlines))
+    return tuple(_frame_sums(offsets, p) for p in properties)
+
+
+def _waterline_segment_properties(waterline):
+    x1, x2 = waterline[:-1, 0], waterline[1:, 0]
+    y1, y2 = waterline[:-1, 1], waterline[1:, 1]
+    dx = x2 - x1
+    area = dx * (y1 + y2) / 2.0
+    momx = dx * (y1**2 + y1 * y2 + y2**2) / 6.0
+    momx2 = dx * (y1**3 + y1 * y2**2 + y1**2 * y2 + y2**3) / 12.0
+    momy = dx * (2 * (x1 * y1 + x2 * y2) + (x1 * y2 + x2 * y1)) / 6.0
+    momy2 = (
+        dx
+        * (
+            y1 * (3 * x1**2 + 1 * x2**2 + 2 * x1 * x2)
+            + y2 * (1 * x1**2 + 3 * x2**2 + 2 * x1 * x2)
         )
+        / 12.0
+    )
     return area, momx, momx2, momy, momy2
 
 
@@ -615,15 +1697,11 @@ def get_waterlines(frames, drafts_ap, drafts_fp=None):
     :param drafts_fp: List of drafts at forward perpendicular. Same as drafts_ap when not provided
     :return: List of waterlines
     """
-    if drafts_fp is None:
-        drafts_fp = drafts_ap
-    result = []
-    for tap, tfp in zip(drafts_ap, drafts_fp):
-        waterline = get_waterline(frames, tap, tfp)
-        result.append(waterline)
-    return result
+    waterlines = get_waterline_arrays(frames, drafts_ap, drafts_fp)
+    return [waterline.tolist() for waterline in waterlines]
 
 
+@profiled
 def get_bm(frames, draft_ap, draft_fp=None):
     """Get distance from center of buoyance to meta center
 
@@ -638,28 +1716,71 @@ def get_bm(frames, draft_ap, draft_fp=None):
     return 2 * mx2 / dispvol
 
 
-def get_kb(frames, draft_ap, draft_fp=None):
+@profiled
+def get_kb(frames, draft_ap, draft_fp=None, method="moments"):
     """Get height of center of buoyance above base line
 
+    With trim, KB is measured perpendicular to the waterline from the base
+    line at the deepest perpendicular.
+
     :param frames: List of half frames
     :param draft_ap: Draft at aft perpendicular
     :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
+    :param method: "moments" to integrate the vertical moments of the submerged
+        sections or "waterlines" to integrate the areas of 41 waterlines over draft
     :return: KB
     """
     if draft_fp is None:
         draft_fp = draft_ap
+    if method == "moments":
+        frames = pack_frames(frames)
+        submerged_frames = get_submerged_frames(frames, draft_ap, draft_fp)
+        return get_kb_from_sections(
+            frames.xs,
+            get_cross_sections(submerged_frames, full=True),
+            get_mom_zs(submerged_frames),
+            draft_ap,
+            draft_fp,
+        )
+    if method != "waterlines":
+        raise ValueError(f"Unknown KB method: {method}")
     max_draft = max(draft_fp, draft_ap)
     drafts_ap = np.linspace(draft_ap - max_draft, draft_ap, 41)
     drafts_fp = np.linspace(draft_fp - max_draft, draft_fp, 41)
     trim_aft = max_draft == draft_ap
-    waterlines = get_waterlines(frames, drafts_ap, drafts_fp)
-    areas = [get_waterline_properties(waterline)[0] for waterline in waterlines]
+    waterlines = get_waterline_arrays(frames, drafts_ap, drafts_fp)
+    areas = get_waterlines_properties(waterlines)[0]
     drafts = drafts_ap if trim_aft else drafts_fp
     dispvol = simpson(areas, x=drafts)
     m = simpson(areas * drafts, x=drafts)
     return m / dispvol
 
 
+def get_kb_from_sections(xs, cross_sections, mom_zs, draft_ap, draft_fp):
+    """Get KB from the submerged sections
+
+    The vertical moment of the submerged volume follows from integrating the
+    sectional moments along x. Arguments may have a leading axis for
+    multiple draft conditions.
+
+    :param xs: X positions of the frames
+    :param cross_sections: Sectional areas of the submerged half frames
+    :param mom_zs: Vertical moments of the submerged half frames (see `get_mom_z`)
+    :param draft_ap: Draft at aft perpendicular
+    :param draft_fp: Draft at forward perpendicular
+    :return: KB as measured by `get_kb`
+    """
+    volume = simpson(cross_sections, x=xs, axis=-1)
+    mom_x = simpson(cross_sections * xs, x=xs, axis=-1)
+    mom_z = simpson(mom_zs, x=xs, axis=-1)
+    # Height above the deepest perpendicular's base line of the waterline
+    # parallel plane through each point is z - slope * (x - x_ref)
+    slope = (draft_fp - draft_ap) / (xs[-1] - xs[0])
+    x_ref = np.where(draft_ap >= draft_fp, 0.0, xs[-1] - xs[0])
+    return (mom_z - slope * (mom_x - x_ref * volume)) / volume
+
+
+@profiled
 def get_km(frames, draft_ap, draft_fp=None):
     """Get meta centric height at specified draft
 
@@ -668,9 +1789,10 @@ def get_km(frames, draft_ap, draft_fp=None):
     :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
     :return: KM = KB + BM
     """
-    return get_bm(frames, draft_ap, draft_fp) + get_kb(frames, draft_ap, draft_fp)
+    return HydrostaticState(frames, draft_ap, draft_fp).km
 
 
+@profiled
 def get_lcf(frames, draft_ap, draft_fp=None):
     """Get longitudinal position of point of floatation (area center of waterline)
 
@@ -683,34 +1805,46 @@ def get_lcf(frames, draft_ap, draft_fp=None):
     return my / a
 
 
+@profiled
 def get_hull_volume(frames):
     """Get volume of hull
 
     :param frames: Get volume enclosed by frames
     """
-    xs = np.array([frame.x for frame in frames])
-    cross_sections = [get_cross_section(frame) for frame in frames]
-    vol = simpson(cross_sections, x=xs)
+    frames = pack_frames(frames)
+    cross_sections = get_cross_sections(frames)
+    vol = simpson(cross_sections, x=frames.xs)
     return vol
 
 
+@profiled
 def get_hull_areas(frames, deck_chine=-1):
     """Get surface area of hull and deck
 
     :return: Tuple of hull area, deck area
     """
-    hull = []
-    deck = []
-    xs = np.array([frame.x for frame in frames])
-    for frame in frames:
-        chine_index = frame.chines[deck_chine]
-        hull.append(np.sum(line_lengths(frame.yz[: chine_index + 1])))
-        deck.append(np.sum(line_lengths(frame.yz[chine_index:])))
-    ha = 2 * simpson(np.asarray(hull), x=xs)
-    da = 2 * simpson(np.asarray(deck), x=xs)
+    frames = pack_frames(frames)
+    chine_counts = np.diff(frames.chine_offsets)
+    if not np.all(chine_counts > max(deck_chine, -deck_chine - 1)):
+        raise IndexError("deck chine index out of range")
+    if deck_chine < 0:
+        chine_indices = frames.chines[frames.chine_offsets[1:] + deck_chine]
+    else:
+        chine_indices = frames.chines[frames.chine_offsets[:-1] + deck_chine]
+    a = frames.points
+    segments = a[1:] - a[:-1]
+    lengths = np.hypot(segments[:, 0], segments[:, 1])
+    girths = _frame_sums(frames.offsets, lengths)
+    cumulative = np.concatenate([[0.0], np.cumsum(lengths)])
+    starts = frames.offsets[:-1]
+    hull = cumulative[starts + chine_indices] - cumulative[starts]
+    deck = girths - hull
+    ha = 2 * simpson(hull, x=frames.xs)
+    da = 2 * simpson(deck, x=frames.xs)
     return ha, da
 
 
+@profiled
 def get_wetted_surface(frames, draft_ap, draft_fp=None):
     """Get area of wetted surface of submerged hull
 
@@ -719,27 +1853,697 @@ def get_wetted_surface(frames, draft_ap, draft_fp=None):
     :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
     :return: Area of wetted surface
     """
-    xs = np.array([frame.x for frame in frames])
+    frames = pack_frames(frames)
     submerged_frames = get_submerged_frames(frames, draft_ap, draft_fp)
-    lengths = [np.sum(line_lengths(submerged.yz)) for submerged in submerged_frames]
-    return 2 * simpson(np.asarray(lengths), x=xs)
+    lengths = get_girths(submerged_frames)
+    return 2 * simpson(lengths, x=frames.xs)
+
+
+def adaptive_simpson(xs, get_values, rtol=1e-4):
+    """Integrate sectional values over stations, using as few stations as possible
+
+    The range of stations is bisected. Each interval is integrated with
+    Simpson's rule on its end and middle stations and on the end and middle
+    stations of both halves. Intervals are bisected further until the two
+    agree within the tolerance on two successive levels, or until all their
+    stations are used. The second level guards against chance agreement
+    where the values have kinks, like where the hull leaves the water. Only
+    the stations that are used are evaluated.
+
+    The error estimate is the sum of the differences between the two Simpson
+    integrals of the accepted intervals, which is a conservative estimate
+    for smooth values. Intervals of three stations, which can't be bisected,
+    compare Simpson's rule with the trapezoidal rule instead.
+
+    When all stations end up being used, the integral is Simpson's rule over
+    all stations, the same as without adaptation. When intervals run out of
+    stations before the error estimate is within the tolerance, a
+    `RuntimeWarning` is issued.
+
+    :param xs: X positions of the stations
+    :param get_values: Function that takes an array of station indices and
+        returns the values at these stations. Values can be arrays with the
+        station as first axis to integrate several quantities at once.
+    :param rtol: Tolerance on the integral relative to its magnitude
+    :return: Tuple of the integral, its error estimate and the indices of
+        the evaluated stations
+    """
+    xs = np.asarray(xs, dtype=float)
+    n = len(xs)
+    cache = {}
+
+    def evaluate(indices):
+        missing = sorted(set(indices) - cache.keys())
+        if missing:
+            cache.update(zip(missing, get_values(np.array(missing))))
+        return np.array([cache[i] for i in indices])
+
+    def integrate(i, m, j):
+        return simpson(evaluate([i, m, j]), x=xs[[i, m, j]], axis=0)
+
+    if n < 3:
+        integral = trapezoid(evaluate(list(range(n))), x=xs, axis=0)
+        return integral, 0 * integral, np.arange(n)
+    length = xs[-1] - xs[0]
+    intervals = [(0, n - 1, False)]
+    integral = 0.0
+    error = 0.0
+    magnitude = None
+    while intervals:
+        # Evaluate the new stations of all intervals of a level at once
+        points = []
+        for i, j, converged in intervals:
+            m = (i + j) // 2
+            points += [i, (i + m) // 2, m, (m + j) // 2, j]
+        evaluate(points)
+        refine = []
+        for i, j, converged in intervals:
+            m = (i + j) // 2
+            coarse = integrate(i, m, j)
+            if j - i == 2:
+                # No stations left to refine with, so the trapezoidal rule
+                # gives the coarse estimate
+                fine = coarse
+                coarse = trapezoid(evaluate([i, m, j]), x=xs[[i, m, j]], axis=0)
+            elif m - i < 2 or j - m < 2:
+                values = evaluate(list(range(i, j + 1)))
+                fine = simpson(values, x=xs[i : j + 1], axis=0)
+            else:
+                fine = integrate(i, (i + m) // 2, m) + integrate(m, (m + j) // 2, j)
+            if magnitude is None:
+                magnitude = np.abs(fine)
+            estimate = np.abs(fine - coarse)
+            tolerance = rtol * magnitude * (xs[j] - xs[i]) / length
+            within = bool(np.all(estimate <= tolerance))
+            if m - i < 2 or j - m < 2 or within and converged:
+                integral = integral + fine
+                error = error + estimate
+            else:
+                refine += [(i, m, within), (m, j, within)]
+        intervals = refine
+    if len(cache) == n:
+        integral = simpson(evaluate(list(range(n))), x=xs, axis=0)
+    if np.any(error > rtol * np.abs(integral)):
+        warnings.warn(
+            "tolerance not met with the stations available: relative error "
+            f"estimate {np.max(error / np.abs(integral)):.3g}",
+            RuntimeWarning,
+            stacklevel=2,
+        )
+    return integral, error, np.array(sorted(cache))
 
 
-def get_full_frames(frames):
-    """Get list of full frames from list of one sided frames
+def _take_frames(frames, indices):
+    """Get packed copy of the frames at indices"""
+    return PackedFrames([frames[i] for i in indices])
 
-    Add mirror image of each frame to turn each frame into a "full" frame
+
+@profiled
+def get_displacement_adaptive(frames, draft_ap, draft_fp=None, rtol=1e-4):
+    """Get displacement at specified draft with error control
+
+    See `adaptive_simpson` for the selection of frames.
+
+    :param frames: List of half frames
+    :param draft_ap: Draft at aft perpendicular
+    :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
+    :param rtol: Relative tolerance
+    :return: Tuple of DISP and its error estimate
     """
-    result = []
-    for frame in frames:
-        full_frame = Frame(x=frame.x)
-        starboard = [[-y, z] for y, z in reversed(frame.yz)]
-        port = [[y, z] for y, z in frame.yz]
-        full_frame.yz = np.asarray(starboard + port)
-        result.append(full_frame)
+    frames = pack_frames(frames)
+    drafts = get_frame_drafts(frames.xs, draft_ap, draft_fp)
+
+    def get_values(indices):
+        submerged = get_submerged_sections(
+            _take_frames(frames, indices), drafts[indices]
+        )
+        return get_cross_sections(submerged)
+
+    disp, error, indices = adaptive_simpson(frames.xs, get_values, rtol)
+    return disp, error
+
+
+@profiled
+def get_lcb_adaptive(frames, draft_ap, draft_fp=None, rtol=1e-4):
+    """Get longitudinal position of center of buoyancy with error control
+
+    See `adaptive_simpson` for the selection of frames.
+
+    :param frames: List of half frames
+    :param draft_ap: Draft at aft perpendicular
+    :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
+    :param rtol: Relative tolerance of displacement and its longitudinal moment
+    :return: Tuple of LCB and its error estimate
+    """
+    frames = pack_frames(frames)
+    xs = frames.xs
+    drafts = get_frame_drafts(xs, draft_ap, draft_fp)
+
+    def get_values(indices):
+        submerged = get_submerged_sections(
+            _take_frames(frames, indices), drafts[indices]
+        )
+        areas = get_cross_sections(submerged)
+        return np.column_stack([areas, areas * xs[indices]])
+
+    (disp, mom), (disp_error, mom_error), indices = adaptive_simpson(
+        xs, get_values, rtol
+    )
+    lcb = mom / disp
+    return lcb, (mom_error + abs(lcb) * disp_error) / disp
+
+
+@profiled
+def get_hull_volume_adaptive(frames, rtol=1e-4):
+    """Get volume of hull with error control
+
+    See `adaptive_simpson` for the selection of frames.
+
+    :param frames: Get volume enclosed by frames
+    :param rtol: Relative tolerance
+    :return: Tuple of volume and its error estimate
+    """
+    frames = pack_frames(frames)
+
+    def get_values(indices):
+        return get_cross_sections(_take_frames(frames, indices))
+
+    vol, error, indices = adaptive_simpson(frames.xs, get_values, rtol)
+    return vol, error
+
+
+@profiled
+def get_wetted_surface_adaptive(frames, draft_ap, draft_fp=None, rtol=1e-4):
+    """Get area of wetted surface of submerged hull with error control
+
+    See `adaptive_simpson` for the selection of frames.
+
+    :param frames: List of half frames
+    :param draft_ap: Draft at aft perpendicular
+    :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
+    :param rtol: Relative tolerance
+    :return: Tuple of area of wetted surface and its error estimate
+    """
+    frames = pack_frames(frames)
+    drafts = get_frame_drafts(frames.xs, draft_ap, draft_fp)
+
+    def get_values(indices):
+        submerged = get_submerged_sections(
+            _take_frames(frames, indices), drafts[indices]
+        )
+        return 2 * get_girths(submerged)
+
+    area, error, indices = adaptive_simpson(frames.xs, get_values, rtol)
+    return area, error
+
+
+class HydrostaticState:
+    """Hydrostatic properties of half frames at a single draft condition
+
+    Each property is computed on first access and then reused, so the
+    submerged frames and the waterline are only constructed once no matter
+    how many properties are requested.
+    """
+
+    def __init__(self, frames, draft_ap, draft_fp=None):
+        """Create state for draft condition
+
+        :param frames: List of half frames
+        :param draft_ap: Draft at aft perpendicular
+        :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
+        """
+        self.frames = pack_frames(frames)
+        self.draft_ap = draft_ap
+        self.draft_fp = draft_ap if draft_fp is None else draft_fp
+
+    @cached_property
+    def submerged_frames(self):
+        """Packed submerged parts of the frames"""
+        return get_submerged_frames(self.frames, self.draft_ap, self.draft_fp)
+
+    @cached_property
+    def cross_sections(self):
+        """Sectional areas of the submerged half frames"""
+        return get_cross_sections(self.submerged_frames, full=True)
+
+    @cached_property
+    def waterline(self):
+        """Waterline as array (see `get_waterline_arrays`)"""
+        return get_waterline_arrays(self.frames, self.draft_ap, self.draft_fp)[0]
+
+    @cached_property
+    def waterline_properties(self):
+        """Properties of the waterline (see `get_waterline_properties`)"""
+        return get_waterline_properties(self.waterline)
+
+    @cached_property
+    def displacement(self):
+        """Displacement volume"""
+        return 2 * simpson(self.cross_sections, x=self.frames.xs)
+
+    @cached_property
+    def lcb(self):
+        """Longitudinal position of center of buoyancy"""
+        xs = self.frames.xs
+        return 2 * simpson(self.cross_sections * xs, x=xs) / self.displacement
+
+    @cached_property
+    def kb(self):
+        """Height of center of buoyancy above base line"""
+        return get_kb_from_sections(
+            self.frames.xs,
+            self.cross_sections,
+            get_mom_zs(self.submerged_frames),
+            self.draft_ap,
+            self.draft_fp,
+        )
+
+    @cached_property
+    def bm(self):
+        """Distance from center of buoyancy to meta center"""
+        a, mx, mx2, my, my2 = self.waterline_properties
+        return 2 * mx2 / self.displacement
+
+    @cached_property
+    def km(self):
+        """Height of meta center above base line"""
+        return self.kb + self.bm
+
+    @cached_property
+    def lcf(self):
+        """Longitudinal position of center of floatation"""
+        a, mx, mx2, my, my2 = self.waterline_properties
+        return my / a
+
+    @cached_property
+    def wetted_surface(self):
+        """Area of wetted surface"""
+        lengths = get_girths(self.submerged_frames)
+        return 2 * simpson(lengths, x=self.frames.xs)
+
+
+class IncrementalHydrostatics:
+    """Hydrostatic properties of half frames that are being edited
+
+    The sectional area, moments, girth and waterline crossings of each frame
+    at its draft are kept between queries. A query only recomputes the
+    frames that were modified (see `Frame.revision`), moved or added since
+    the previous query, after which the longitudinal integration runs on the
+    kept arrays.
+    """
+
+    def __init__(self, frames):
+        """Create incremental hydrostatics for frames
+
+        :param frames: List of half frames. Frames modified or added through
+            their methods after creation are taken into account.
+        """
+        self.frames = frames
+        self.recomputed = 0
+        self._keys = []
+        self._areas = np.zeros(0)
+        self._mom_ys = np.zeros(0)
+        self._mom_zs = np.zeros(0)
+        self._girths = np.zeros(0)
+        self._crossings = []
+
+    def update(self, draft_ap, draft_fp=None):
+        """Recompute the contributions of modified frames
+
+        :param draft_ap: Draft at aft perpendicular
+        :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
+        :return: Number of recomputed frames
+        """
+        frames = self.frames
+        if isinstance(frames, PackedFrames):
+            xs = frames.xs
+            drafts = get_frame_drafts(xs, draft_ap, draft_fp).tolist()
+            revisions = frames.frame_revisions.tolist()
+            counts = frames.counts.tolist()
+            owners = [frames] * len(frames)
+        else:
+            xs = np.array([frame.x for frame in frames], dtype=float)
+            drafts = get_frame_drafts(xs, draft_ap, draft_fp).tolist()
+            revisions = [frame.revision for frame in frames]
+            counts = [len(frame) for frame in frames]
+            owners = frames
+        keys = list(zip(owners, revisions, xs.tolist(), counts, drafts))
+        # Frames are matched to the kept contributions by identity and
+        # revision, so inserting or deleting frames only recomputes new ones
+        old = {(id(key[0]),) + key[1:]: i for i, key in enumerate(self._keys)}
+        kept = [old.get((id(key[0]),) + key[1:], -1) for key in keys]
+        kept = np.array(kept, dtype=int)
+        dirty = np.nonzero(kept < 0)[0]
+        areas, mom_ys, mom_zs, girths = np.zeros((4, len(keys)))
+        i = np.nonzero(kept >= 0)[0]
+        areas[i] = self._areas[kept[i]]
+        mom_ys[i] = self._mom_ys[kept[i]]
+        mom_zs[i] = self._mom_zs[kept[i]]
+        girths[i] = self._girths[kept[i]]
+        crossings = [self._crossings[i] if i >= 0 else None for i in kept]
+        if len(dirty):
+            packed = PackedFrames([frames[i] for i in dirty])
+            dirty_drafts = np.array(drafts)[dirty]
+            submerged = get_submerged_sections(packed, dirty_drafts)
+            areas[dirty] = get_cross_sections(submerged, full=True)
+            mom_ys[dirty] = get_mom_ys(submerged)
+            mom_zs[dirty] = get_mom_zs(submerged)
+            girths[dirty] = get_girths(submerged)
+            _, crossing_frames, dirty_crossings = get_waterline_crossings(
+                packed, dirty_drafts[None, :]
+            )
+            ends = np.searchsorted(crossing_frames, np.arange(len(dirty) + 1))
+            for i, start, end in zip(dirty, ends[:-1], ends[1:]):
+                crossings[i] = dirty_crossings[start:end]
+        self._keys = keys
+        self._areas = areas
+        self._mom_ys = mom_ys
+        self._mom_zs = mom_zs
+        self._girths = girths
+        self._crossings = crossings
+        self.recomputed = len(dirty)
+        return self.recomputed
+
+    def get_sections(self, draft_ap, draft_fp=None):
+        """Get contributions of all frames
+
+        :param draft_ap: Draft at aft perpendicular
+        :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
+        :return: Tuple of x positions, sectional areas of the submerged half
+            frames, their moments about Y and Z axis (see `get_mom_y` and
+            `get_mom_z`) and their girths
+        """
+        self.update(draft_ap, draft_fp)
+        xs = np.array([key[2] for key in self._keys], dtype=float)
+        return xs, self._areas, self._mom_ys, self._mom_zs, self._girths
+
+    def get_waterline(self, draft_ap, draft_fp=None):
+        """Get waterline (see `get_waterline_arrays`)
+
+        :param draft_ap: Draft at aft perpendicular
+        :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
+        :return: (n, 3) array with x, y, z of the waterline points
+        """
+        self.update(draft_ap, draft_fp)
+        counts = [len(crossing) for crossing in self._crossings]
+        if not sum(counts):
+            return np.zeros((0, 3))
+        crossing_frames = np.repeat(np.arange(len(counts)), counts)
+        crossings = np.concatenate(self._crossings)
+        return _get_waterline_path(crossings, crossing_frames, len(counts))
+
+    def get_displacement(self, draft_ap, draft_fp=None):
+        """Get displacement (see `get_displacement`)"""
+        xs, areas, mom_ys, mom_zs, girths = self.get_sections(draft_ap, draft_fp)
+        return 2 * simpson(areas, x=xs)
+
+    def get_lcb(self, draft_ap, draft_fp=None):
+        """Get LCB (see `get_lcb`)"""
+        xs, areas, mom_ys, mom_zs, girths = self.get_sections(draft_ap, draft_fp)
+        return simpson(areas * xs, x=xs) / simpson(areas, x=xs)
+
+    def get_kb(self, draft_ap, draft_fp=None):
+        """Get KB (see `get_kb`)"""
+        if draft_fp is None:
+            draft_fp = draft_ap
+        xs, areas, mom_ys, mom_zs, girths = self.get_sections(draft_ap, draft_fp)
+        return get_kb_from_sections(xs, areas, mom_zs, draft_ap, draft_fp)
+
+    def get_bm(self, draft_ap, draft_fp=None):
+        """Get BM (see `get_bm`)"""
+        waterline = self.get_waterline(draft_ap, draft_fp)
+        a, mx, mx2, my, my2 = get_waterline_properties(waterline)
+        return 2 * mx2 / self.get_displacement(draft_ap, draft_fp)
+
+    def get_km(self, draft_ap, draft_fp=None):
+        """Get KM (see `get_km`)"""
+        return self.get_kb(draft_ap, draft_fp) + self.get_bm(draft_ap, draft_fp)
+
+    def get_lcf(self, draft_ap, draft_fp=None):
+        """Get LCF (see `get_lcf`)"""
+        waterline = self.get_waterline(draft_ap, draft_fp)
+        a, mx, mx2, my, my2 = get_waterline_properties(waterline)
+        return my / a
+
+    def get_wetted_surface(self, draft_ap, draft_fp=None):
+        """Get wetted surface (see `get_wetted_surface`)"""
+        xs, areas, mom_ys, mom_zs, girths = self.get_sections(draft_ap, draft_fp)
+        return 2 * simpson(girths, x=xs)
+
+
+class BonjeanCurves:
+    """Submerged sectional area and moments of each frame as function of draft
+
+    Clipping a frame at a draft only cuts the segments that cross the
+    waterline, so the submerged area and its moments (see `get_cross_section`,
+    `get_mom_y` and `get_mom_z`) are piecewise polynomials of the draft with
+    breaks at the z coordinates of the frame points. The polynomials of all
+    frames are built once, after which a draft query takes a binary search
+    and a cubic evaluation per frame.
+    """
+
+    def __init__(self, frames):
+        """Build Bonjean curves
+
+        :param frames: List of half frames
+        """
+        frames = pack_frames(frames)
+        self.xs = frames.xs.copy()
+        breaks, origins, starts, coefficients = [], [], [], []
+        break_counts = []
+        for i in range(len(frames)):
+            b, o, v, c = self._get_frame_curves(frames.frame_points(i))
+            breaks.append(b)
+            origins.append(o)
+            starts.append(v)
+            coefficients.append(c)
+            break_counts.append(len(b))
+        self.breaks = np.concatenate(breaks)
+        self.break_offsets = _get_offsets(break_counts)
+        # Each frame has a piece below its first break and one after each break
+        self.piece_offsets = self.break_offsets + np.arange(len(frames) + 1)
+        self.origins = np.concatenate(origins)
+        self.start_values = np.concatenate(starts)
+        self.coefficients = np.concatenate(coefficients)
+        frame_indices = np.repeat(np.arange(len(frames)), break_counts)
+        if len(self.breaks):
+            self._z_min, z_max = self.breaks.min(), self.breaks.max()
+        else:
+            self._z_min, z_max = 0.0, 0.0
+        self._z_range = z_max - self._z_min
+        self._span = 2 * self._z_range + 2.0
+        # Sorted search keys of all breaks of all frames
+        self._keys = frame_indices * self._span + (self.breaks - self._z_min)
+
+    @staticmethod
+    def _get_frame_curves(a):
+        breaks = np.unique(a[:, 1])
+        pieces = len(breaks) + 1
+        # The piece below the first break has the first break as origin, or
+        # zero for a frame without points
+        origins = np.concatenate([breaks[:1] if len(breaks) else [0.0], breaks])
+        coefficients = np.zeros((pieces, 3, 3))
+        starts = np.zeros((pieces, 3))
+        if len(a) < 2:
+            return breaks, origins, starts, coefficients
+        z1, z2 = a[:-1, 1], a[1:, 1]
+        y1, y2 = a[:-1, 0], a[1:, 0]
+        segments = np.nonzero(z1 != z2)[0]
+        lo = np.minimum(z1, z2)[segments]
+        hi = np.maximum(z1, z2)[segments]
+        sign = np.sign(z2 - z1)[segments]
+        slope = ((y2 - y1) / np.where(z1 != z2, z2 - z1, 1.0))[segments]
+        y_lo = np.where(z1 < z2, y1, y2)[segments]
+        # Pair each segment with the intervals between breaks it spans
+        first = np.searchsorted(breaks, lo)
+        spans = np.searchsorted(breaks, hi) - first
+        pair_segments = np.repeat(np.arange(len(segments)), spans)
+        intervals = np.arange(len(pair_segments)) - np.repeat(
+            np.cumsum(spans) - spans, spans
+        )
+        intervals += first[pair_segments]
+        z = breaks[intervals]
+        width = breaks[intervals + 1] - z
+        sign, m = sign[pair_segments], slope[pair_segments]
+        y = y_lo[pair_segments] + m * (z - lo[pair_segments])
+        # Integrals of y, y^2 / 2 and y z over u = draft - z for 0 <= u <= width
+        pair_coefficients = sign[:, None, None] * np.stack(
+            [
+                np.stack([y, m / 2.0, np.zeros_like(y)], -1),
+                np.stack([y**2 / 2.0, y * m / 2.0, m**2 / 6.0], -1),
+                np.stack([y * z, (y + m * z) / 2.0, m / 3.0], -1),
+            ],
+            1,
+        )
+        np.add.at(coefficients, intervals + 1, pair_coefficients)
+        powers = width[:, None] ** np.arange(1, 4)
+        np.add.at(
+            starts, intervals + 2, np.einsum("pqk,pk->pq", pair_coefficients, powers)
+        )
+        starts = np.cumsum(starts, axis=0)
+        return breaks, origins, starts, coefficients
+
+    def evaluate(self, drafts):
+        """Get submerged sectional areas and moments of the half frames
+
+        :param drafts: Draft for each frame. May have leading axes for multiple conditions
+        :return: Tuple of arrays of sectional areas, moments about Y and moments about Z
+        """
+        drafts = np.asarray(drafts, dtype=float)
+        frame_indices = np.arange(len(self.xs))
+        queries = frame_indices * self._span + np.clip(
+            drafts - self._z_min, -0.5, self._z_range + 0.5
+        )
+        local = np.searchsorted(self._keys, queries, side="right")
+        pieces = self.piece_offsets[:-1] + local - self.break_offsets[:-1]
+        u = drafts - self.origins[pieces]
+        powers = u[..., None] ** np.arange(1, 4)
+        values = self.start_values[pieces] + np.einsum(
+            "...qk,...k->...q", self.coefficients[pieces], powers
+        )
+        return values[..., 0], values[..., 1], values[..., 2]
+
+    def cross_sections(self, draft_ap, draft_fp=None):
+        """Get submerged sectional areas of the half frames
+
+        :param draft_ap: Draft at aft perpendicular
+        :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
+        :return: Array of sectional areas
+        """
+        return self.evaluate(get_frame_drafts(self.xs, draft_ap, draft_fp))[0]
+
+    def displacement(self, draft_ap, draft_fp=None):
+        """Get displacement volume (see `get_displacement`)
+
+        :param draft_ap: Draft at aft perpendicular
+        :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
+        """
+        return 2 * simpson(self.cross_sections(draft_ap, draft_fp), x=self.xs)
+
+    def lcb(self, draft_ap, draft_fp=None):
+        """Get longitudinal position of center of buoyancy (see `get_lcb`)
+
+        :param draft_ap: Draft at aft perpendicular
+        :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
+        """
+        cross_sections = self.cross_sections(draft_ap, draft_fp)
+        xs = self.xs
+        return simpson(cross_sections * xs, x=xs) / simpson(cross_sections, x=xs)
+
+    def kb(self, draft_ap, draft_fp=None):
+        """Get height of center of buoyancy above base line (see `get_kb`)
+
+        :param draft_ap: Draft at aft perpendicular
+        :param draft_fp: Draft at forward perpendicular. Same as draft_ap when not provided
+        """
+        if draft_fp is None:
+            draft_fp = draft_ap
+        areas, mom_ys, mom_zs = self.evaluate(
+            get_frame_drafts(self.xs, draft_ap, draft_fp)
+        )
+        return get_kb_from_sections(self.xs, areas, mom_zs, draft_ap, draft_fp)
+
+
+@profiled
+def hydrostatic_table(frames, drafts_ap, drafts_fp=None, chunk_points=1 << 18):
+    """Get curves of form for a range of drafts
+
+    The conditions are clipped together in chunks with about chunk_points
+    frame points in total, so memory use doesn't grow with the number of
+    drafts. Values that involve the displacement are NaN where the hull
+    isn't submerged.
+
+    :param frames: List of half frames
+    :param drafts_ap: Array of drafts at aft perpendicular
+    :param drafts_fp: Array of drafts at forward perpendicular. Same as drafts_ap when not provided
+    :param chunk_points: Number of frame points to clip at once
+    :return: Structured array with fields draft_ap, draft_fp, displacement, lcb,
+        kb, bm, km, lcf, waterplane_area and wetted_surface
+    """
+    frames = pack_frames(frames)
+    drafts_ap = np.atleast_1d(np.asarray(drafts_ap, dtype=float))
+    if drafts_fp is None:
+        drafts_fp = drafts_ap
+    drafts_fp = np.broadcast_to(np.asarray(drafts_fp, dtype=float), drafts_ap.shape)
+    result = np.zeros(
+        len(drafts_ap),
+        dtype=[
+            (name, float)
+            for name in (
+                "draft_ap",
+                "draft_fp",
+                "displacement",
+                "lcb",
+                "kb",
+                "bm",
+                "km",
+                "lcf",
+                "waterplane_area",
+                "wetted_surface",
+            )
+        ],
+    )
+    result["draft_ap"] = drafts_ap
+    result["draft_fp"] = drafts_fp
+    size = max(1, chunk_points // max(1, len(frames.points)))
+    for start in range(0, len(result), size):
+        _fill_hydrostatic_rows(frames, result[start : start + size])
     return result
 
 
+def _fill_hydrostatic_rows(frames, rows):
+    """Fill rows of `hydrostatic_table` from their drafts, clipping all at once"""
+    xs = frames.xs
+    drafts_ap, drafts_fp = rows["draft_ap"], rows["draft_fp"]
+    count = len(rows)
+    drafts = get_frame_drafts(xs, drafts_ap[:, None], drafts_fp[:, None])
+    submerged = get_submerged_sections(frames.tile(count), drafts.ravel())
+    areas = get_cross_sections(submerged, full=True).reshape(count, -1)
+    mom_zs = get_mom_zs(submerged).reshape(count, -1)
+    girths = get_girths(submerged).reshape(count, -1)
+    volumes = simpson(areas, x=xs, axis=1)
+    mom_xs = simpson(areas * xs, x=xs, axis=1)
+    wet = volumes != 0
+
+    def divide(a, b, where):
+        return np.divide(a, b, out=np.full(count, np.nan), where=where)
+
+    rows["displacement"] = 2 * volumes
+    rows["lcb"] = divide(mom_xs, volumes, wet)
+    rows["kb"] = np.nan
+    rows["kb"][wet] = get_kb_from_sections(
+        xs, areas[wet], mom_zs[wet], drafts_ap[wet], drafts_fp[wet]
+    )
+    waterlines = get_waterline_arrays(frames, drafts_ap, drafts_fp)
+    a, mx, mx2, my, my2 = get_waterlines_properties(waterlines)
+    rows["bm"] = divide(mx2, volumes, wet)
+    rows["lcf"] = divide(my, a, a != 0)
+    rows["waterplane_area"] = 2 * a
+    rows["km"] = rows["kb"] + rows["bm"]
+    rows["wetted_surface"] = 2 * simpson(girths, x=xs, axis=1)
+
+
+@profiled
+def get_full_frames(frames):
+    """Get list of full frames from list of one sided frames
+
+    Add mirror image of each frame to turn each frame into a "full" frame
+    """
+    frames = pack_frames(frames)
+    counts = frames.counts
+    starts = np.repeat(frames.offsets[:-1], 2 * counts)
+    full_offsets = 2 * frames.offsets
+    local = np.arange(full_offsets[-1]) - np.repeat(full_offsets[:-1], 2 * counts)
+    counts = np.repeat(counts, 2 * counts)
+    # First the mirrored starboard side in reverse order, then the port side
+    starboard = local < counts
+    source = np.where(starboard, starts + counts - 1 - local, starts + local - counts)
+    points = frames.points[source]
+    points[starboard, 0] *= -1
+    return PackedFrames.from_arrays(frames.xs.copy(), points, full_offsets)
+
+
+@profiled
 def get_rotated_frames(full_frames, phi):
     """Get copy of all frames rotated about the x axis by some angle
 
@@ -749,38 +2553,128 @@ def get_rotated_frames(full_frames, phi):
     :param phi: Angle to rotate by
     :return: List of rotated/heeled over frames
     """
-    result = []
-    for frame in full_frames:
-        new_frame = Frame(x=frame.x)
-        new_frame.yz = np.zeros_like(frame.yz)
-        new_frame.yz[:, 0] = np.cos(phi) * frame.yz[:, 0] + np.sin(phi) * frame.yz[:, 1]
-        new_frame.yz[:, 1] = (
-            -np.sin(phi) * frame.yz[:, 0] + np.cos(phi) * frame.yz[:, 1]
-        )
-        result.append(new_frame)
-    return result
+    full_frames = pack_frames(full_frames)
+    c, s = np.cos(phi), np.sin(phi)
+    rotation = np.array([[c, -s], [s, c]])
+    points = full_frames.points @ rotation
+    return PackedFrames.from_arrays(
+        full_frames.xs.copy(), points, full_frames.offsets.copy()
+    )
+
+
+@profiled
+def resample_frames(frames, count):
+    """Get frames with the same number of points, evenly spaced by arc length
+
+    Chines are kept as vertices. The points between the chines are
+    distributed over the sections of the frames in proportion to the mean
+    length of each section, so the chines have the same index in all frames.
+    The `dense` array of the result can be used for (frames, points, 2)
+    array operations.
+
+    :param frames: List of half frames with the same number of chines
+    :param count: Number of points of each frame
+    :return: Packed frames
+    """
+    frames = pack_frames(frames)
+    frame_count = len(frames)
+    counts = frames.counts
+    chine_counts = np.diff(frames.chine_offsets)
+    if np.any(counts == 0):
+        raise ValueError("can't resample empty frames")
+    if np.any(chine_counts != chine_counts[0]):
+        raise ValueError("frames have different numbers of chines")
+    section_count = chine_counts[0] + 1
+    if count < section_count + 1:
+        raise ValueError(f"at least {section_count + 1} points required")
+    starts = frames.offsets[:-1]
+    ends = frames.offsets[1:]
+    bounds = np.column_stack(
+        [
+            np.zeros(frame_count, dtype=int),
+            frames.chines.reshape(frame_count, section_count - 1),
+            counts - 1,
+        ]
+    )
+    a = frames.points
+    segment_lengths = np.hypot(*(a[1:] - a[:-1]).T)
+    cumulative = np.concatenate([[0.0], np.cumsum(segment_lengths)])
+    bound_lengths = cumulative[starts[:, None] + bounds]
+    section_lengths = np.diff(bound_lengths, axis=1)
+
+    # Each section gets at least one segment. The others are distributed by
+    # the largest remainder method
+    weights = section_lengths.mean(axis=0)
+    if weights.sum() <= 0:
+        weights = np.ones(section_count)
+    extra = count - 1 - section_count
+    shares = weights / weights.sum() * extra
+    segments = 1 + np.floor(shares).astype(int)
+    remainders = np.argsort(np.floor(shares) - shares, kind="stable")
+    segments[remainders[: count - 1 - segments.sum()]] += 1
+    chine_indices = np.cumsum(segments)[:-1]
+
+    # Arc length of each new point along its frame
+    section = np.repeat(np.arange(section_count), segments)
+    first = np.repeat(np.cumsum(segments) - segments, segments)
+    fraction = (np.arange(count - 1) - first) / np.repeat(segments, segments)
+    t = bound_lengths[:, section] + fraction * section_lengths[:, section]
+    t = np.column_stack([t, bound_lengths[:, -1]])
+
+    # Interpolate on the segments of the own frame only
+    j = np.searchsorted(cumulative, t, side="right") - 1
+    j = np.maximum(np.minimum(j, ends[:, None] - 2), starts[:, None])
+    k = np.minimum(j + 1, len(a) - 1)
+    length = cumulative[k] - cumulative[j]
+    w = np.divide(t - cumulative[j], length, out=np.zeros_like(t), where=length > 0)
+    w = np.clip(w, 0.0, 1.0)
+    points = a[j] + w[..., None] * (a[k] - a[j])
+    # Exact vertices at the ends and chines
+    vertices = np.concatenate([[0], chine_indices, [count - 1]])
+    points[:, vertices] = a[starts[:, None] + bounds]
+    return PackedFrames.from_dense(
+        frames.xs.copy(),
+        points,
+        np.broadcast_to(chine_indices, (frame_count, section_count - 1)),
+    )
 
 
 def submerge_frames(full_frames, draft, trim=0):
     """Get displacement and CB of frames at specified draft and trim
 
+    The frames are moved down by the draft in place. Use
+    `get_submerged_properties` to leave the frames untouched.
+
     :param full_frames: List of symmetrical (but potentially rotated) frames
     :param draft: Draft to submerge the frames by
     :param trim: Trim (Difference between Aft and forward draft)
     :return: Tuple of Displacement, XCB, YCB, ZCB
     """
-    draft_ap = draft
-    draft_fp = draft - trim
-    xs = np.array([frame.x for frame in full_frames])
-    drafts = xs / (xs[-1] - xs[0]) * (draft_fp - draft_ap) + draft_ap
+    result = get_submerged_properties(full_frames, draft, trim)
+    drafts = get_frame_drafts(pack_frames(full_frames).xs, draft, draft - trim)
     for i, frame in enumerate(full_frames):
         frame.yz[:, 1] -= drafts[i]
-    submerged_frames = get_submerged_frames(full_frames, 0)
-    cross_sections = [
-        get_cross_section(submerged, full=True) for submerged in submerged_frames
-    ]
-    mom_ys = [get_mom_y(submerged) for submerged in submerged_frames]
-    mom_zs = [get_mom_z(submerged) for submerged in submerged_frames]
+    return result
+
+
+@profiled
+def get_submerged_properties(full_frames, draft, trim=0):
+    """Get displacement and CB of frames at specified draft and trim
+
+    Like `submerge_frames`, but without moving the frames
+
+    :param full_frames: List of symmetrical (but potentially rotated) frames
+    :param draft: Draft to submerge the frames by
+    :param trim: Trim (Difference between Aft and forward draft)
+    :return: Tuple of Displacement, XCB, YCB, ZCB. ZCB is relative to the waterline
+    """
+    full_frames = pack_frames(full_frames)
+    xs = full_frames.xs
+    drafts = get_frame_drafts(xs, draft, draft - trim)
+    submerged_frames = get_submerged_sections(full_frames, drafts)
+    cross_sections = get_cross_sections(submerged_frames, full=True)
+    mom_ys = get_mom_ys(submerged_frames)
+    mom_zs = get_mom_zs(submerged_frames) - drafts * cross_sections
     disp = simpson(cross_sections, x=xs)
     momx = simpson(cross_sections * xs, x=xs)
     momy = simpson(mom_ys, x=xs)
@@ -788,21 +2682,101 @@ def submerge_frames(full_frames, draft, trim=0):
     return disp, momx / disp, momy / disp, momz / disp
 
 
-def float_frames(full_frames, dispvol, lcb):
+@profiled
+def float_frames(
+    full_frames, dispvol, lcb, tol=1e-9, max_iterations=50, draft_trim=None
+):
     """Get draft and trim for specified displacement and LCB
 
+    Solved with Newton's method. The Jacobian follows from the area and
+    moments of the waterplane, integrated from the frame breadths at the
+    waterline.
+
     :param full_frames: List of full (symmetrical) frames
     :param dispvol: Desired displacement
     :param lcb: Longitudinal position of center of buoyancy relative to midships (0.5 L)
+    :param tol: Tolerance relative to displacement and length of the frames
+    :param max_iterations: Maximum number of Newton iterations
+    :param draft_trim: Initial guess of draft and trim. Estimated from the main frame when not provided
+    :return: Array of draft and trim
     """
-
-    def submerge(draft_trim):
+    full_frames = pack_frames(full_frames)
+    xs = full_frames.xs
+    length = xs[-1] - xs[0]
+
+    if draft_trim is None:
+        main_frame = full_frames[len(full_frames) // 2]
+        draft = get_mom_z(main_frame) / get_cross_section(main_frame, full=True)
+        trim = 0.0
+    else:
         draft, trim = draft_trim
-        ff = copy.deepcopy(full_frames)
-        v, x = submerge_frames(ff, draft, trim)[:2]
-        return dispvol - v, lcb - x
 
-    main_frame = full_frames[len(full_frames) // 2]
-    draft_guess = get_mom_z(main_frame) / get_cross_section(main_frame, full=True)
+    for _ in range(max_iterations):
+        v, x = get_submerged_properties(full_frames, draft, trim)[:2]
+        count("float_frames.residuals")
+        dv, dx = v - dispvol, x - lcb
+        if abs(dv) <= tol * dispvol and abs(dx) <= tol * length:
+            return np.array([draft, trim])
+        breadths = get_waterline_breadths(
+            full_frames, get_frame_drafts(xs, draft, draft - trim)
+        )
+        a = simpson(breadths, x=xs)
+        my = simpson(breadths * xs, x=xs)
+        my2 = simpson(breadths * xs**2, x=xs)
+        # Drafts at the frames are draft - trim * x / length
+        jacobian = np.array(
+            [
+                [a, -my / length],
+                [(my - x * a) / v, (x * my - my2) / length / v],
+            ]
+        )
+        try:
+            step = np.linalg.solve(jacobian, [dv, dx])
+        except np.linalg.LinAlgError:
+            break
+        count("float_frames.iterations")
+        draft -= step[0]
+        trim -= step[1]
+    from scipy.optimize import NoConvergence
+
+    raise NoConvergence(np.array([draft, trim]))
+
+
+@profiled
+def gz_curve(frames, dispvol, lcb, kg, heel_angles):
+    """Get righting arm curve
 
-    return newton_krylov(submerge, [draft_guess, 0])
+    All frames are rotated for all heel angles at once. The equilibrium at
+    each angle starts from the solution at the previous angle.
+
+    :param frames: List of half frames
+    :param dispvol: Displacement volume
+    :param lcb: Longitudinal position of center of gravity/buoyancy
+    :param kg: Height of center of gravity above base line
+    :param heel_angles: Array of heel angles (radians)
+    :return: Structured array with fields heel, gz, draft, trim and sinkage
+        (draft relative to upright draft)
+    """
+    full_frames = get_full_frames(frames)
+    heel_angles = np.atleast_1d(np.asarray(heel_angles, dtype=float))
+    c, s = np.cos(heel_angles), np.sin(heel_angles)
+    rotations = np.stack([np.stack([c, -s], -1), np.stack([s, c], -1)], -2)
+    rotated = np.einsum("nj,ajk->ank", full_frames.points, rotations)
+
+    result = np.zeros(
+        len(heel_angles),
+        dtype=[(name, float) for name in ("heel", "gz", "draft", "trim", "sinkage")],
+    )
+    result["heel"] = heel_angles
+    upright = float_frames(full_frames, dispvol, lcb)
+    draft_trim = upright
+    for i, points in enumerate(rotated):
+        heeled_frames = PackedFrames.from_arrays(
+            full_frames.xs, points, full_frames.offsets
+        )
+        draft_trim = float_frames(heeled_frames, dispvol, lcb, draft_trim=draft_trim)
+        ycb = get_submerged_properties(heeled_frames, *draft_trim)[2]
+        result["gz"][i] = ycb - kg * s[i]
+        result["draft"][i], result["trim"][i] = draft_trim
+    result["sinkage"] = result["draft"] - upright[0]
+    return result
@@ -0,0 +1,249 @@
+from concurrent.futures import ProcessPoolExecutor
+
+import matplotlib
+import matplotlib.pyplot as plt
+import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.collections import LineCollection
+from matplotlib.figure import Figure
+
+from .lines import get_waterline_arrays, pack_frames
+
+
+def plot_frames(
+    frames,
+    title=None,
+    show_legend=False,
+    show_waterline=None,
+    filename=None,
+    ylim=None,
+    xlim=None,
+    cb=None,
+):
+    """Plot frames of lines plan using matplotlib
+
+    :param frames: List of frames. Typically `Lines.frames`
+    :param title: Title of plot
+    :param show_legend: Whether to show a legend on the plot
+    :param show_waterline: Show waterline a z level indicated by the value of this parameter
+    :param filename: Filename to plot to rather than show on screen
+    :param ylim: Y limits of plot range (z range of plan)
+    :param xlim: X limits of plot range (y range of plan)
+    :param cb: Plot center of buoyance at this location (3D point)
+    """
+    plt.clf()
+    if title:
+        plt.title(title)
+    for i, frame in enumerate(frames):
+        a = np.asarray(frame.yz)
+        plt.plot(a.T[0, :], a.T[1, :], label=str(i))
+    if show_legend:
+        plt.legend()
+    if show_waterline is not None:
+        plt.axhline(y=show_waterline, color="b")
+    if cb is not None:
+        plt.scatter(cb[1], cb[2], marker="o", s=10, c="#000000")
+        plt.axvline(x=cb[1], color="black", linestyle="--", linewidth=1)
+    plt.axis("equal")
+    if ylim is not None:
+        plt.ylim(*ylim)
+    if xlim is not None:
+        plt.xlim(*xlim)
+    if filename is None:
+        plt.show()
+    else:
+        plt.savefig("%s.png" % filename)
+
+
+def plot_waterlines(
+    frames,
+    drafts_ap,
+    drafts_fp=None,
+    title=None,
+    show_frames=False,
+    show_legend=False,
+    filename=None,
+):
+    """Plot waterlines
+
+    Interpolate waterlines from frame data and plot using matplotlib
+    :param frames: List of frames (Typically `Lines.frames`)
+    :param drafts_ap: List of drafs levels at aft perpendicular to draw waterlines at
+    :param drafts_fp: List of drafs levels at forward perpendicular. Assumed equal to `drafts_ap` when not provided
+    :param title: Plot title
+    :param show_frames: Whether to show the frame locations
+    :param show_legend: Whether to show plot legend
+    :param filename: Filename to save plot to rather than show it on the screen
+    """
+    plt.clf()
+    if title:
+        plt.title(title)
+    waterlines = get_waterline_arrays(frames, drafts_ap, drafts_fp)
+    for i, waterline in enumerate(waterlines):
+        if not len(waterline):
+            continue
+        plt.plot(waterline.T[0, :], waterline.T[1, :], label=str(i))
+    if show_frames:
+        i = 0
+        for x, y, z in waterlines[-1]:
+            plt.plot([x, x], [0, y], label=str(i))
+            i += 1
+    plt.axis("equal")
+    if filename is None:
+        plt.show()
+    else:
+        plt.savefig("%s.png" % filename)
+
+
+class Renderer:
+    """Renderer of lines plans to image files
+
+    Uses a figure of its own on the Agg backend rather than the global
+    pyplot state. The figure is reused for each plot. All lines of a plot
+    are drawn as a single `LineCollection`.
+    """
+
+    def __init__(self, size=(6.4, 4.8), dpi=100):
+        """Create renderer
+
+        :param size: Size of the images in inches
+        :param dpi: Resolution of the images in dots per inch
+        """
+        self.figure = Figure(figsize=size, dpi=dpi)
+        FigureCanvasAgg(self.figure)
+        self.axes = self.figure.add_subplot()
+
+    @staticmethod
+    def _get_colors(count):
+        colors = matplotlib.rcParams["axes.prop_cycle"].by_key()["color"]
+        return [colors[i % len(colors)] for i in range(count)]
+
+    def _start(self, title):
+        self.axes.clear()
+        if title:
+            self.axes.set_title(title)
+
+    def _finish(self, segments, xlim=None, ylim=None):
+        self.axes.add_collection(
+            LineCollection(segments, colors=self._get_colors(len(segments)))
+        )
+        self.axes.set_aspect("equal", adjustable="datalim")
+        self.axes.autoscale_view()
+        if xlim is not None:
+            self.axes.set_xlim(*xlim)
+        if ylim is not None:
+            self.axes.set_ylim(*ylim)
+
+    def draw_frames(
+        self, frames, title=None, show_waterline=None, ylim=None, xlim=None, cb=None
+    ):
+        """Draw frames of lines plan (see `plot_frames`)
+
+        :param frames: List of frames. Typically `Lines.frames`
+        :param title: Title of plot
+        :param show_waterline: Show waterline a z level indicated by the value of this parameter
+        :param ylim: Y limits of plot range (z range of plan)
+        :param xlim: X limits of plot range (y range of plan)
+        :param cb: Plot center of buoyance at this location (3D point)
+        """
+        frames = pack_frames(frames)
+        self._start(title)
+        segments = np.split(frames.points, frames.offsets[1:-1])
+        if show_waterline is not None:
+            self.axes.axhline(y=show_waterline, color="b")
+        if cb is not None:
+            self.axes.scatter(cb[1], cb[2], marker="o", s=10, c="#000000")
+            self.axes.axvline(x=cb[1], color="black", linestyle="--", linewidth=1)
+        self._finish(segments, xlim, ylim)
+
+    def draw_waterlines(
+        self, frames, drafts_ap, drafts_fp=None, title=None, show_frames=False
+    ):
+        """Draw waterlines (see `plot_waterlines`)
+
+        :param frames: List of frames (Typically `Lines.frames`)
+        :param drafts_ap: List of drafs levels at aft perpendicular to draw waterlines at
+        :param drafts_fp: List of drafs levels at forward perpendicular. Assumed equal to `drafts_ap` when not provided
+        :param title: Plot title
+        :param show_frames: Whether to show the frame locations
+        """
+        self._start(title)
+        waterlines = get_waterline_arrays(frames, drafts_ap, drafts_fp)
+        segments = [waterline[:, :2] for waterline in waterlines if len(waterline)]
+        if show_frames:
+            for x, y, z in waterlines[-1]:
+                segments.append(np.array([[x, 0.0], [x, y]]))
+        self._finish(segments)
+
+    def save(self, filename):
+        """Save the drawing to file
+
+        :param filename: Filename. The format follows from the extension
+        """
+        self.figure.savefig(filename)
+
+    def render(self, kind, frames, filename, **kwargs):
+        """Draw and save plot
+
+        :param kind: "frames" or "waterlines"
+        :param frames: List of frames
+        :param filename: Filename to save the plot to
+        :param kwargs: Arguments for `draw_frames` or `draw_waterlines`
+        """
+        if kind == "frames":
+            self.draw_frames(frames, **kwargs)
+        elif kind == "waterlines":
+            self.draw_waterlines(frames, **kwargs)
+        else:
+            raise ValueError(f"Unknown plot kind: {kind}")
+        self.save(filename)
+
+
+# Renderer of the worker process, set once by init_renderer
+_renderer = None
+
+
+def init_renderer(size=(6.4, 4.8), dpi=100):
+    """Set up the renderer in a worker process
+
+    :param size: Size of the images in inches
+    :param dpi: Resolution of the images in dots per inch
+    """
+    global _renderer
+    _renderer = Renderer(size, dpi)
+
+
+def render_job(job):
+    """Render a plot with the renderer of this worker
+
+    :param job: Tuple of kind, frames, filename and optionally a dictionary
+        of arguments (see `Renderer.render`)
+    :return: Filename of the plot
+    """
+    kind, frames, filename, *options = job
+    _renderer.render(kind, frames, filename, **(options[0] if options else {}))
+    return filename
+
+
+def export_plots(jobs, size=(6.4, 4.8), dpi=100, max_workers=None, chunksize=1):
+    """Render many plots in a pool of worker processes
+
+    Each worker renders its plots with a single reused `Renderer`.
+
+    :param jobs: Iterable of (kind, frames, filename, options) tuples (see `render_job`)
+    :param size: Size of the images in inches
+    :param dpi: Resolution of the images in dots per inch
+    :param max_workers: Number of worker processes. Defaults to the number of CPUs.
+        With 1, plots are rendered in this process.
+    :param chunksize: Number of jobs sent to a worker at once
+    :return: Generator of the filenames of the rendered plots
+    """
+    jobs = ((kind, pack_frames(frames), *rest) for kind, frames, *rest in jobs)
+    if max_workers == 1:
+        init_renderer(size, dpi)
+        yield from map(render_job, jobs)
+        return
+    with ProcessPoolExecutor(
+        max_workers=max_workers, initializer=init_renderer, initargs=(size, dpi)
+    ) as executor:
+        yield from executor.map(render_job, jobs, chunksize=chunksize)
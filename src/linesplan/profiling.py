@@ -0,0 +1,173 @@
+"""Call counters and timing of the hydrostatic functions
+
+Recording is off by default. It is switched on within a `profile` context:
+
+    with profile() as stats:
+        gz_curve(frames, dispvol, lcb, kg, heel_angles)
+    print(stats.to_json())
+
+or for the whole process by setting the environment variable
+LINESPLAN_PROFILE. When its value ends with ".json", the statistics are
+written to that file at exit. Otherwise they are available from
+`get_global_profile`.
+
+When recording is off, the only overhead of a profiled function is one
+extra call and an attribute lookup.
+"""
+
+import atexit
+import functools
+import json
+import os
+import time
+from contextlib import contextmanager
+
+
+class Profile:
+    """Statistics of profiled functions and counters"""
+
+    def __init__(self):
+        self.functions = {}
+        self.counters = {}
+
+    def record(self, name, elapsed, points=0):
+        """Record call of function
+
+        :param name: Name of the function
+        :param elapsed: Wall time of the call in seconds
+        :param points: Number of frame points processed
+        """
+        stats = self.functions.get(name)
+        if stats is None:
+            stats = self.functions[name] = {"calls": 0, "time": 0.0, "points": 0}
+        stats["calls"] += 1
+        stats["time"] += elapsed
+        stats["points"] += points
+
+    def count(self, name, n=1):
+        """Increment counter
+
+        :param name: Name of the counter
+        :param n: Amount to increment by
+        """
+        self.counters[name] = self.counters.get(name, 0) + n
+
+    def reset(self):
+        """Clear all statistics"""
+        self.functions.clear()
+        self.counters.clear()
+
+    def to_dict(self):
+        """Get statistics as dictionary
+
+        :return: Dictionary with "functions", mapping function names to their
+            number of calls, cumulative wall time and number of points, and
+            "counters"
+        """
+        return {
+            "functions": {name: dict(stats) for name, stats in self.functions.items()},
+            "counters": dict(self.counters),
+        }
+
+    def to_json(self, **kwargs):
+        """Get statistics as JSON string
+
+        :param kwargs: Arguments for `json.dumps`
+        """
+        return json.dumps(self.to_dict(), **kwargs)
+
+
+class _State:
+    # Profiles that are recording
+    profiles = []
+
+
+_state = _State()
+_global_profile = Profile()
+
+
+def is_enabled():
+    """Whether any profile is recording"""
+    return bool(_state.profiles)
+
+
+def get_global_profile():
+    """Get the profile that records when LINESPLAN_PROFILE is set"""
+    return _global_profile
+
+
+@contextmanager
+def profile():
+    """Record statistics within context
+
+    :return: Context manager giving the `Profile` that records
+    """
+    result = Profile()
+    _state.profiles = _state.profiles + [result]
+    try:
+        yield result
+    finally:
+        _state.profiles = [p for p in _state.profiles if p is not result]
+
+
+def count(name, n=1):
+    """Increment counter in the recording profiles
+
+    :param name: Name of the counter
+    :param n: Amount to increment by
+    """
+    for p in _state.profiles:
+        p.count(name, n)
+
+
+def count_points(frames):
+    """Get the number of points of frames"""
+    points = getattr(frames, "points", None)
+    if points is not None:
+        return len(points)
+    try:
+        return sum(len(frame) for frame in frames)
+    except TypeError:
+        return 0
+
+
+def profiled(function=None, *, name=None, points=count_points):
+    """Decorator that records calls of a function in the recording profiles
+
+    :param function: Function to decorate
+    :param name: Name to record the function by. The name of the function
+        when not provided
+    :param points: Function that gets the number of processed points from the
+        first argument, or None to not count points
+    """
+    if function is None:
+        return functools.partial(profiled, name=name, points=points)
+    if name is None:
+        name = function.__name__
+
+    @functools.wraps(function)
+    def wrapper(*args, **kwargs):
+        if not _state.profiles:
+            return function(*args, **kwargs)
+        start = time.perf_counter()
+        try:
+            return function(*args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - start
+            n = points(args[0]) if points is not None and args else 0
+            for p in _state.profiles:
+                p.record(name, elapsed, n)
+
+    return wrapper
+
+
+def _write_global_profile(filename):
+    with open(filename, "w") as f:
+        f.write(_global_profile.to_json(indent=2))
+
+
+_environment = os.environ.get("LINESPLAN_PROFILE", "")
+if _environment not in ("", "0"):
+    _state.profiles = [_global_profile]
+    if _environment.endswith(".json"):
+        atexit.register(_write_global_profile, _environment)
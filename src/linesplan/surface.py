@@ -0,0 +1,78 @@
+import numpy as np
+from scipy.interpolate import make_interp_spline
+
+from .lines import PackedFrames, pack_frames, resample_frames
+
+
+class HullSurface:
+    """Smooth hull surface through the frames of a lines plan
+
+    The frames are resampled to the same number of points (see
+    `resample_frames`), after which each point index is interpolated along
+    x with a B-spline. Chines are kept as lines of the surface, so stations
+    at any x have their chines at the same point indices as the frames.
+    Generated stations are cached.
+    """
+
+    def __init__(self, frames, count=None, degree=3):
+        """Fit surface through frames
+
+        :param frames: List of half frames with the same number of chines
+        :param count: Number of points of the stations. Maximum number of
+            points of the frames when not provided
+        :param degree: Degree of the B-splines along x
+        """
+        frames = pack_frames(frames)
+        if count is None:
+            count = int(frames.counts.max())
+        resampled = resample_frames(frames, count)
+        self.frames = resampled
+        self.xs = resampled.xs
+        self.count = count
+        self.chines = resampled[0].chines if len(resampled) else ()
+        degree = min(degree, len(self.xs) - 1)
+        self.spline = make_interp_spline(self.xs, resampled.dense, k=degree, axis=0)
+        self._stations = {}
+
+    def __call__(self, xs):
+        """Evaluate surface without caching
+
+        :param xs: X positions of the stations
+        :return: (stations, points, 2) array with the points of the stations
+        """
+        points = self.spline(np.asarray(xs, dtype=float))
+        # Half frames don't cross the center line
+        np.maximum(points[..., 0], 0.0, out=points[..., 0])
+        return points
+
+    def get_stations(self, xs):
+        """Get stations at x positions
+
+        :param xs: X positions of the stations, within the range of the frames
+        :return: Packed half frames
+        """
+        xs = np.asarray(xs, dtype=float).reshape(-1)
+        if len(xs) and (xs.min() < self.xs[0] or xs.max() > self.xs[-1]):
+            raise ValueError("station outside the range of the frames")
+        missing = sorted(set(xs.tolist()) - self._stations.keys())
+        if missing:
+            self._stations.update(zip(missing, self(missing)))
+        points = np.array([self._stations[x] for x in xs.tolist()])
+        chines = np.broadcast_to(self.chines, (len(xs), len(self.chines)))
+        return PackedFrames.from_dense(
+            xs, points.reshape(len(xs), self.count, 2), chines
+        )
+
+    def get_uniform_stations(self, count):
+        """Get evenly spaced stations from the first to the last frame
+
+        Use an odd count for Simpson integration.
+
+        :param count: Number of stations
+        :return: Packed half frames
+        """
+        return self.get_stations(np.linspace(self.xs[0], self.xs[-1], count))
+
+    def clear_cache(self):
+        """Drop the cached stations"""
+        self._stations.clear()
@@ -28,6 +28,17 @@ def test(ctx):
         ctx.run(cmd, echo=True)
 
 
+@task
+def benchmark(ctx, output="build/reports/benchmarks.json", compare=None, quick=False):
+    """Run benchmarks"""
+    cmd = f"python benchmarks/bench_linesplan.py --output {output}"
+    if compare:
+        cmd += f" --compare {compare}"
+    if quick:
+        cmd += " --quick"
+    ctx.run(cmd, echo=True)
+
+
 @task
 def build(ctx):
     """Build"""
@@ -6,6 +6,9 @@ import unittest
 from datetime import datetime
 
 import __main__ as main
+import numpy as np
+
+from linesplan.lines import Frame
 
 scriptdir = os.path.dirname(os.path.realpath(__file__))
 _module_path = scriptdir + "/.."
@@ -38,6 +41,15 @@ def file_age(filename):
     return time.time() - os.path.getmtime(filename)
 
 
+def get_cylinder_frames(count=5):
+    """Get half frames of a cylindrical body of radius 1, with frames 1 apart"""
+    f = np.linspace(0, np.pi, 101)
+    return [
+        Frame([[y, z] for y, z in zip(np.sin(f), 1 - np.cos(f))], x=float(i))
+        for i in range(count)
+    ]
+
+
 log_line()
 log.info("Started logging: %s" % str(datetime.now()))
 log_line()
@@ -0,0 +1,42 @@
+import unittest
+
+from conftest import get_cylinder_frames
+
+import linesplan.batch
+from linesplan.batch import *
+from linesplan.lines import *
+
+
+class TestFunctions(unittest.TestCase):
+
+    def setUp(self):
+        self.frames = get_cylinder_frames()
+
+    def test_evaluate_conditions(self):
+        drafts = [(0.5, 0.5), (0.75, 0.5), (1.0, 1.0)]
+        conditions = [
+            (
+                get_displacement(self.frames, tap, tfp),
+                get_lcb(self.frames, tap, tfp),
+                kg,
+            )
+            for (tap, tfp), kg in zip(drafts, (0.5, 0.6, 0.7))
+        ]
+        heel_angles = np.radians([10.0, 20.0])
+        serial = list(
+            evaluate_conditions(self.frames, conditions, heel_angles, max_workers=1)
+        )
+        parallel = list(
+            evaluate_conditions(self.frames, conditions, heel_angles, max_workers=2)
+        )
+        self.assertEqual(len(conditions), len(parallel))
+        # Evaluating in this process leaves the worker state alone
+        self.assertIsNone(linesplan.batch._frames)
+        for (tap, tfp), condition, s, p in zip(drafts, conditions, serial, parallel):
+            self.assertEqual(condition[0], p["dispvol"])
+            self.assertAlmostEqual(tap, p["draft"], delta=1e-8)
+            self.assertAlmostEqual(tap - tfp, p["trim"], delta=1e-8)
+            self.assertAlmostEqual(s["gm"], p["gm"])
+            self.assertTrue(np.allclose(s["gz"], p["gz"]))
+            expected = (1 - condition[2]) * np.sin(heel_angles)
+            self.assertTrue(np.allclose(expected, p["gz"], atol=1e-3))
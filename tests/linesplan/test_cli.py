@@ -0,0 +1,70 @@
+import csv
+import os
+import unittest
+from pathlib import Path
+
+from linesplan.cli import *
+from linesplan.lines import *
+
+scriptdir = Path(os.path.dirname(os.path.realpath(__file__)))
+plan = str(scriptdir / "../data/tally_ho.json")
+output = scriptdir / "../output"
+
+
+class TestCli(unittest.TestCase):
+
+    def setUp(self):
+        self.frames = load_lines_plan(plan).frames
+
+    def test_parse_grid(self):
+        self.assertTrue(np.allclose([0.5, 1.0, 1.5], parse_grid("0.5:1.5:3")))
+        self.assertTrue(np.allclose([-0.1, 0.0, 0.2], parse_grid("-0.1,0,0.2")))
+        self.assertTrue(np.allclose([2.0], parse_grid("2")))
+
+    def test_table(self):
+        filename = output / "cli_table.csv"
+        main(
+            [
+                "table",
+                plan,
+                "--drafts",
+                "1:2:3",
+                "--trims",
+                "0,0.1",
+                "-o",
+                str(filename),
+            ]
+        )
+        with open(filename, newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(6, len(rows))
+        self.assertEqual({plan}, {row["plan"] for row in rows})
+        for row in rows:
+            tap = float(row["draft_ap"])
+            tfp = float(row["draft_fp"])
+            self.assertAlmostEqual(
+                get_displacement(self.frames, tap, tfp), float(row["displacement"])
+            )
+
+    def test_float_gz(self):
+        dispvol = get_displacement(self.frames, 1.5)
+        lcb = get_lcb(self.frames, 1.5)
+        filename = output / "cli_float.csv"
+        arguments = [f"--displacement={dispvol}", f"--lcb={lcb}", "--kg=1.5,2.0"]
+        main(["float", plan, *arguments, "-j", "1", "-o", str(filename)])
+        with open(filename, newline="") as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(2, len(rows))
+        for row in rows:
+            self.assertAlmostEqual(1.5, float(row["draft"]), delta=1e-6)
+            self.assertAlmostEqual(0.0, float(row["trim"]), delta=1e-6)
+        filename = output / "cli_gz.npz"
+        main(["gz", plan, plan, *arguments, "--heels", "0:30:4", "-o", str(filename)])
+        with np.load(filename) as results:
+            self.assertEqual(4, len(results.files))
+            for name in results.files:
+                result = results[name]
+                self.assertTrue(name.startswith("tally_ho_"))
+                self.assertTrue(np.allclose([0, 10, 20, 30], result["heel"]))
+                self.assertAlmostEqual(0.0, result["gz"][0], delta=1e-6)
+                self.assertTrue(np.all(result["gz"][1:] > 0))
@@ -26,6 +26,29 @@ class TestDxf(unittest.TestCase):
     def test_get_arcs(self):
         self.assertEqual(0, len(self.dxf.get_arcs()))
 
+    def test_layers_cached(self):
+        lines = self.dxf.get_lines(layer="LAYER1")
+        self.assertEqual(self.dxf.get_lines(), lines)
+        self.assertEqual(0, len(self.dxf.get_lines(layer="OTHER")))
+        lines[0].reverse()
+        self.assertNotEqual(self.dxf.get_lines(layer="LAYER1"), lines)
+
+    def test_entities(self):
+        doc = ezdxf.new()
+        msp = doc.modelspace()
+        msp.add_line((0, 1), (2, 3), dxfattribs={"layer": "A"})
+        msp.add_lwpolyline([(0, 0), (1, 1), (2, 5)], dxfattribs={"layer": "B"})
+        msp.add_arc((1, 2), 3, 10, 80, dxfattribs={"layer": "A"})
+        filename = "output/entities.dxf"
+        doc.saveas(filename)
+        dxf = Dxf(filename)
+        self.assertEqual([[[0, 1], [2, 3]], [[0, 0], [1, 1], [2, 5]]], dxf.get_lines())
+        self.assertEqual([[[0, 1], [2, 3]]], dxf.get_lines(layer="A"))
+        self.assertEqual(0, len(dxf.get_arcs(layer="B")))
+        arc = dxf.get_arcs(layer="A")[0]
+        self.assertEqual([1, 2], arc.center)
+        self.assertEqual((3, 10, 80), (arc.radius, arc.start_angle, arc.end_angle))
+
 
 class TestSpline(unittest.TestCase):
 
@@ -65,3 +88,18 @@ class TestFunctions(unittest.TestCase):
         self.assertEqual([2], frame.chines)
         expected = [[1, 0], [2, 1], [3, 2], [4, 4]]
         self.assertEqual(expected, frames[0].yz)
+
+    def test_collect_frames_order(self):
+        # Both line2 and line3 connect to the end of line1: first one is joined
+        line1 = [[0, 0], [1, 0]]
+        line2 = [[2, 1], [1, 0.001]]
+        line3 = [[1, 0], [1, 1]]
+        line4 = [[5, 5], [6, 6]]
+        lines = [line1, line2, line3, line4]
+        frames = collect_frames(lines)
+        self.assertEqual([], lines)
+        self.assertEqual(3, len(frames))
+        self.assertEqual([[0, 0], [1, 0], [2, 1]], frames[0].yz)
+        self.assertEqual([1], frames[0].chines)
+        self.assertEqual([[1, 0], [1, 1]], frames[1].yz)
+        self.assertEqual([[5, 5], [6, 6]], frames[2].yz)
@@ -1,10 +1,14 @@
 import difflib
 import math
 import os
+import subprocess
+import sys
 import unittest
+import warnings
 from pathlib import Path
 
 import pytest
+from conftest import get_cylinder_frames
 
 from linesplan.lines import *
 
@@ -12,18 +16,254 @@ scriptdir = Path(os.path.dirname(os.path.realpath(__file__)))
 
 
 class TestLines(unittest.TestCase):
-    pass
+
+    def setUp(self):
+        self.lines = Lines()
+        self.lines.frames = get_cylinder_frames()
+
+    def test_cache(self):
+        lines = self.lines
+        lines.enable_cache()
+        displacement = lines.get_displacement(0.5)
+        self.assertEqual(get_displacement(lines.frames, 0.5), displacement)
+        self.assertEqual(displacement, lines.get_displacement(0.5, 0.5))
+        info = lines.cache.info()
+        self.assertEqual((1, 1), (info["hits"], info["misses"]))
+        lines.get_kb(0.5)
+        lines.get_kb(0.5, method="waterlines")
+        self.assertEqual(3, len(lines.cache))
+
+    def test_cache_invalidation(self):
+        lines = self.lines
+        lines.enable_cache()
+        displacement = lines.get_displacement(1.0)
+        lines.frames[2].scale(2.0)
+        self.assertGreater(lines.get_displacement(1.0), displacement)
+        self.assertEqual(1, len(lines.cache))
+        lines.frames[2].scale(0.5)
+        lines.frames[2].delete(50)
+        self.assertLess(lines.get_displacement(1.0), displacement)
+        lines.pack()
+        expected = get_displacement(lines.frames, 1.0)
+        self.assertEqual(expected, lines.get_displacement(1.0))
+        lines.frames[0].offset([0.0, 0.1])
+        expected = get_displacement(lines.frames, 1.0)
+        self.assertEqual(expected, lines.get_displacement(1.0))
+        self.assertEqual(0, lines.cache.hits)
+
+    def test_incremental(self):
+        lines = self.lines
+        frames = lines.frames
+        incremental = lines.incremental
+        self.assertEqual(5, incremental.update(0.5, 0.7))
+        self.assertEqual(0, incremental.update(0.5, 0.7))
+        frames[2].insert(50, [1.2, 1.0])
+        frames[3].delete(20)
+        self.assertEqual(2, incremental.update(0.5, 0.7))
+        frames.insert(1, Frame(frames[0].yz, x=0.5))
+        self.assertEqual(1, incremental.update(0.5, 0.7))
+        for name in ("displacement", "lcb", "kb", "bm", "lcf", "wetted_surface"):
+            expected = globals()["get_" + name](frames, 0.5, 0.7)
+            result = getattr(incremental, "get_" + name)(0.5, 0.7)
+            self.assertAlmostEqual(expected, result, delta=1e-12, msg=name)
+        expected = get_waterline_arrays(frames, [0.5], [0.7])[0]
+        self.assertTrue(np.array_equal(expected, incremental.get_waterline(0.5, 0.7)))
+        frames[1].yz[0] = [0.004, 0.0]
+        frames[1].touch()
+        incremental.update(1.5)
+        lines.close_frames()
+        # The last points of all frames are snapped to the center line
+        self.assertEqual(len(frames), incremental.update(1.5))
+        expected = get_displacement(frames, 1.5)
+        self.assertAlmostEqual(expected, incremental.get_displacement(1.5), delta=1e-12)
+        lines.pack()
+        self.assertIsNot(incremental, lines.incremental)
+        incremental = lines.incremental
+        incremental.update(0.6)
+        lines.frames[4].scale(1.1)
+        self.assertEqual(1, incremental.update(0.6))
+        expected = get_displacement(lines.frames, 0.6)
+        self.assertAlmostEqual(expected, incremental.get_displacement(0.6), delta=1e-12)
+        lines.frames[0].yz[0] = [0.004, 0.0]
+        lines.frames[0].touch()
+        incremental.update(1.5)
+        lines.close_frames()
+        self.assertEqual(1, incremental.update(1.5))
+        expected = get_displacement(lines.frames, 1.5)
+        self.assertAlmostEqual(expected, incremental.get_displacement(1.5), delta=1e-12)
+
+    def test_cache_eviction(self):
+        lines = self.lines
+        lines.enable_cache(maxsize=2)
+        lines.get_displacement(0.5)
+        lines.get_displacement(0.6)
+        lines.get_displacement(0.5)
+        lines.get_displacement(0.7)
+        self.assertEqual(2, len(lines.cache))
+        lines.get_displacement(0.5)
+        self.assertEqual(2, lines.cache.hits)
+        lines.get_displacement(0.6)
+        self.assertEqual(4, lines.cache.misses)
+
+
+class TestPackedFrames(unittest.TestCase):
+
+    def setUp(self):
+        self.frames = [
+            Frame([[0.0, 0.0], [1.0, 0.0], [1.0, 1.0], [0.0, 1.0]], x=0.0),
+            Frame([[0.0, 0.0], [2.0, 0.0], [2.0, 2.0]], x=1.0),
+        ]
+        self.frames[0].chines = [1, 2]
+        self.frames[1].chines = [1]
+        self.packed = PackedFrames(self.frames)
+
+    def test_views(self):
+        self.assertEqual(2, len(self.packed))
+        self.assertEqual((7, 2), self.packed.points.shape)
+        self.assertEqual([0, 4, 7], list(self.packed.offsets))
+        frame = self.packed[1]
+        self.assertEqual(1.0, frame.x)
+        self.assertEqual((1,), frame.chines)
+        self.assertEqual(self.frames[1].yz, frame.yz.tolist())
+        frame.scale(2.0)
+        self.assertEqual(4.0, self.packed.points[5, 0])
+        self.assertEqual([0.0, 0.0], self.packed[0].yz[0].tolist())
+
+    def test_insert_delete(self):
+        frame = self.packed[0]
+        frame.insert(1, [0.5, 0.0], chine=True)
+        self.assertEqual((1, 2, 3), frame.chines)
+        self.assertEqual([0, 5, 8], list(self.packed.offsets))
+        self.assertEqual([0.0, 0.0], self.packed[1].yz[0].tolist())
+        frame.delete(2)
+        self.assertEqual((1, 2), frame.chines)
+        self.assertEqual([0.5, 0.0], frame.yz[1].tolist())
+        plain = self.frames[0]
+        plain.insert(1, [0.5, 0.0], chine=True)
+        plain.delete(2)
+        self.assertEqual(plain.yz, frame.yz.tolist())
+        self.assertEqual([1, 2], plain.chines)
+
+    def test_sequence(self):
+        self.packed.append(Frame([[0.0, 0.0], [3.0, 3.0]], x=2.0))
+        self.assertEqual(3, len(self.packed))
+        self.assertEqual([0, 4, 7, 9], list(self.packed.offsets))
+        del self.packed[0]
+        self.assertEqual([1.0, 2.0], list(self.packed.xs))
+        self.assertEqual([0, 3, 5], list(self.packed.offsets))
+        self.assertEqual((1,), self.packed[0].chines)
+
+    def test_invalid_index(self):
+        frame = Frame([[0.0, 0.0], [3.0, 3.0]], x=2.0)
+        revision = self.packed.revision
+        for i in (2, -3):
+            with self.assertRaises(IndexError):
+                self.packed[i] = frame
+            with self.assertRaises(IndexError):
+                del self.packed[i]
+        with self.assertRaises(TypeError):
+            self.packed[0:1] = [frame]
+        with self.assertRaises(TypeError):
+            del self.packed[0:1]
+        self.assertEqual(revision, self.packed.revision)
+        self.assertEqual([0.0, 1.0], list(self.packed.xs))
+        self.assertEqual([0, 4, 7], list(self.packed.offsets))
+
+    def test_reorder(self):
+        frame = self.packed[1]
+        self.packed.reverse()
+        self.assertEqual([1.0, 0.0], list(self.packed.xs))
+        self.assertEqual([0, 3, 7], list(self.packed.offsets))
+        self.assertEqual(self.frames[1].yz, self.packed[0].yz.tolist())
+        self.assertEqual(self.frames[0].yz, self.packed[1].yz.tolist())
+        self.assertEqual([(1,), (1, 2)], [f.chines for f in self.packed])
+        self.assertRaises(IndexError, lambda: frame.yz)
+        self.packed[0], self.packed[1] = (
+            self.packed[1].to_frame(),
+            self.packed[0].to_frame(),
+        )
+        self.assertEqual([0.0, 1.0], list(self.packed.xs))
+        self.assertEqual(self.frames[0].yz, self.packed[0].yz.tolist())
+        self.assertEqual(self.frames[1].yz, self.packed[1].yz.tolist())
+        self.packed.insert(0, self.packed[1])
+        self.assertEqual([1.0, 0.0, 1.0], list(self.packed.xs))
+        self.assertEqual(self.frames[1].yz, self.packed[0].yz.tolist())
+        frame = self.packed.pop(0)
+        self.assertEqual(self.frames[1].yz, frame.yz)
+        self.assertEqual([1], frame.chines)
+        self.assertEqual([0.0, 1.0], list(self.packed.xs))
+
+    def test_kernels(self):
+        areas = get_cross_sections(self.packed)
+        expected = [get_cross_section(frame) for frame in self.frames]
+        self.assertTrue(np.allclose(expected, areas))
+        moms = get_mom_zs(self.packed)
+        expected = [get_mom_z(frame) for frame in self.frames]
+        self.assertTrue(np.allclose(expected, moms))
+        girths = get_girths(self.frames)
+        self.assertTrue(np.allclose([3.0, 4.0], girths))
+
+    def test_load_save_packed(self):
+        f1 = scriptdir / "../data/tally_ho.json"
+        f2 = scriptdir / "../output/tally_ho.json"
+        lines = load_lines_plan(f1)
+        packed = load_lines_plan(f1, packed=True)
+        self.assertTrue(packed.packed)
+        for draft in (1.0, 1.5):
+            self.assertAlmostEqual(
+                get_displacement(lines.frames, draft),
+                get_displacement(packed.frames, draft),
+                delta=1e-12,
+            )
+        save_lines_plan(packed, f2)
+        self.assertEqual(
+            [frame.yz for frame in lines.frames],
+            [frame.yz for frame in load_lines_plan(f2).frames],
+        )
+
+    def test_load_save_binary(self):
+        f1 = scriptdir / "../data/tally_ho.json"
+        f2 = scriptdir / "../output/tally_ho.lpb"
+        lines = load_lines_plan(f1)
+        save_lines_plan(lines, f2, binary=True)
+        loaded = load_lines_plan(f2)
+        self.assertTrue(loaded.packed)
+        self.assertEqual(lines.name, loaded.name)
+        self.assertEqual(
+            [frame.yz for frame in lines.frames],
+            [frame.yz.tolist() for frame in loaded.frames],
+        )
+        self.assertEqual(
+            [frame.chines for frame in lines.frames],
+            [list(frame.chines) for frame in loaded.frames],
+        )
+        loaded.frames[0].scale(2.0)
+        unpacked = load_lines_plan(f2, packed=False)
+        self.assertFalse(unpacked.packed)
+        self.assertEqual(
+            [frame.yz for frame in lines.frames],
+            [frame.yz for frame in unpacked.frames],
+        )
+
+    def test_save_binary_in_place(self):
+        f1 = scriptdir / "../data/tally_ho.json"
+        f2 = scriptdir / "../output/tally_ho_in_place.lpb"
+        lines = load_lines_plan(f1)
+        save_lines_plan(lines, f2, binary=True)
+        loaded = load_lines_plan(f2)
+        loaded.frames[0].scale(1.01)
+        expected = [frame.yz.tolist() for frame in loaded.frames]
+        loaded.save(f2, binary=True)
+        self.assertEqual(expected, [frame.yz.tolist() for frame in loaded.frames])
+        saved = load_lines_plan(f2)
+        self.assertEqual(expected, [frame.yz.tolist() for frame in saved.frames])
+        self.assertEqual([], list(f2.parent.glob("*.tmp")))
 
 
 class TestFunctions(unittest.TestCase):
 
     def setUp(self):
-        # Create a cylindrical body
-        f = np.linspace(0, np.pi, 101)
-        ys = np.sin(f)
-        zs = 1 - np.cos(f)
-        frame = [[y, z] for y, z in zip(ys, zs)]
-        self.frames = [Frame(frame, x=float(i)) for i in range(5)]
+        self.frames = get_cylinder_frames()
         for frame in self.frames:
             frame.chines.append(50)
 
@@ -39,6 +279,127 @@ class TestFunctions(unittest.TestCase):
         diffs = list(difflib.unified_diff(s1, s2))
         self.assertFalse(diffs)
 
+    def test_reader_writer(self):
+        f1 = scriptdir / "../data/tally_ho.json"
+        f2 = scriptdir / "../output/tally_ho_stream.json"
+        lines = load_lines_plan(f1)
+        with LinesPlanReader(f1, chunk_size=100) as reader:
+            with LinesPlanWriter(f2, "Tally Ho") as writer:
+                for frame in reader:
+                    writer.write(frame)
+            self.assertEqual(lines.name, reader.name)
+        with open(f1) as f:
+            s1 = f.read()
+        with open(f2) as f:
+            self.assertEqual(s1, f.read())
+        # Name after the frames and frames without chines
+        with open(f2, "w") as f:
+            f.write('{"frames": [{"x": 1, "yz": [[0, 0], [1, 1]]}], "name": "a"}')
+        with LinesPlanReader(f2, chunk_size=1) as reader:
+            frames = list(reader)
+            self.assertEqual("a", reader.name)
+        self.assertEqual([[[0, 0], [1, 1]]], [frame.yz for frame in frames])
+        self.assertEqual([[]], [frame.chines for frame in frames])
+        # Failed conversion leaves the file as it was
+        with self.assertRaises(RuntimeError):
+            with LinesPlanWriter(f2, "b") as writer:
+                writer.write(frames[0])
+                raise RuntimeError("conversion failed")
+        with LinesPlanReader(f2) as reader:
+            self.assertEqual(1, len(list(reader)))
+            self.assertEqual("a", reader.name)
+        self.assertEqual([], list(f2.parent.glob("*.tmp")))
+
+    def test_resample_frames(self):
+        lines = load_lines_plan(scriptdir / "../data/tally_ho.json")
+        frames = resample_frames(lines.frames, 200)
+        self.assertEqual((45, 200, 2), frames.dense.shape)
+        for frame, resampled in zip(lines.frames, frames):
+            self.assertEqual(2, len(set(resampled.chines)))
+            self.assertEqual(frames[0].chines, resampled.chines)
+            vertices = zip(frame.chines + [0, -1], list(resampled.chines) + [0, -1])
+            for i, j in vertices:
+                self.assertEqual(frame.yz[i], resampled.yz[j].tolist())
+        self.assertAlmostEqual(
+            get_displacement(lines.frames, 1.5),
+            get_displacement(frames, 1.5),
+            delta=1e-2,
+        )
+        # Heel sweep on the dense array of the full frames
+        full = get_full_frames(frames)
+        phis = np.radians([10.0, 20.0])
+        c, s = np.cos(phis), np.sin(phis)
+        rotations = np.array([[c, -s], [s, c]]).transpose(2, 0, 1)
+        heeled = np.einsum("fkj,ajl->afkl", full.dense, rotations)
+        for phi, points in zip(phis, heeled):
+            expected = get_rotated_frames(full, phi).dense
+            self.assertTrue(np.allclose(expected, points))
+        # Chines can't be kept when frames have different numbers of them
+        lines.frames[0].chines = [1]
+        with self.assertRaises(ValueError):
+            resample_frames(lines.frames, 200)
+
+    def test_adaptive_simpson(self):
+        xs = np.linspace(0, np.pi, 257)
+        integral, error, indices = adaptive_simpson(xs, lambda i: np.sin(xs[i]), 1e-6)
+        self.assertLess(abs(integral - 2.0), error)
+        self.assertLess(error, 2e-6)
+        self.assertLess(len(indices), len(xs))
+        # Several quantities at once
+        integral, error, indices = adaptive_simpson(
+            xs, lambda i: np.column_stack([np.sin(xs[i]), xs[i]]), 1e-6
+        )
+        self.assertTrue(np.allclose([2.0, np.pi**2 / 2], integral))
+        # Too few stations for the tolerance
+        xs = np.linspace(0, np.pi, 5)
+        with self.assertWarns(RuntimeWarning):
+            integral, error, indices = adaptive_simpson(
+                xs, lambda i: np.sin(xs[i]), 1e-6
+            )
+        self.assertGreater(error, abs(integral - 2.0))
+        self.assertEqual(5, len(indices))
+
+    def test_adaptive(self):
+        frames = load_lines_plan(scriptdir / "../data/tally_ho.json").frames
+        for function, adaptive, args in (
+            (get_displacement, get_displacement_adaptive, (1.5,)),
+            (get_lcb, get_lcb_adaptive, (1.5, 1.7)),
+            (get_hull_volume, get_hull_volume_adaptive, ()),
+            (get_wetted_surface, get_wetted_surface_adaptive, (1.5,)),
+        ):
+            expected = function(frames, *args)
+            with warnings.catch_warnings():
+                warnings.simplefilter("error")
+                result, error = adaptive(frames, *args, rtol=1e-2)
+            self.assertLess(error, 1e-2 * abs(expected))
+            self.assertAlmostEqual(expected, result, delta=error)
+        # Tolerance that can't be met with the stations of the plan
+        with self.assertWarns(RuntimeWarning):
+            result, error = get_displacement_adaptive(frames, 1.5, rtol=1e-5)
+        self.assertEqual(get_displacement(frames, 1.5), result)
+        self.assertGreater(error, 1e-5 * result)
+
+    def test_get_waterline_arrays(self):
+        # Frames crossing the waterline three times
+        yz = [[0, 0], [1, 0], [1, 2], [2, 2], [2, 0], [3, 0], [3, 3], [0, 3]]
+        frames = [Frame(yz, x=float(i)) for i in range(3)]
+        expected = [
+            [0, 2, 1],
+            [1, 1, 1],
+            [2, 2, 1],
+            [1, 2, 1],
+            [0, 3, 1],
+            [1, 3, 1],
+            [2, 3, 1],
+        ]
+        waterlines = get_waterline_arrays(frames, [1.0, 4.0])
+        self.assertEqual(expected, waterlines[0].tolist())
+        self.assertEqual((0, 3), waterlines[1].shape)
+        self.assertEqual(expected, get_waterline(frames, 1.0))
+        waterline = get_waterline(self.frames, 1.0)
+        self.assertEqual(5, len(waterline))
+        self.assertTrue(np.allclose([[x, 1.0, 1.0] for x in range(5)], waterline))
+
     def test_get_waterline_properties(self):
         w1 = [[1.0, 0.0, 2.0], [1.0, 1.0, 2.0], [2.0, 2.0, 2.0], [2.0, 0.0, 2.0]]
         w2 = [[-2.0, 0.0, 2.0], [-2.0, 2.0, 2.0], [-1.0, 1.0, 2.0], [-1.0, 0.0, 2.0]]
@@ -54,6 +415,18 @@ class TestFunctions(unittest.TestCase):
         self.assertEqual(m1y2, m2y2)
         self.assertEqual(m1y2, 15.0 / 4.0)
 
+    def test_get_waterlines_properties(self):
+        w1 = [[1.0, 0.0, 2.0], [1.0, 1.0, 2.0], [2.0, 2.0, 2.0], [2.0, 0.0, 2.0]]
+        w2 = [[-2.0, 0.0, 2.0], [-2.0, 2.0, 2.0], [-1.0, 1.0, 2.0], [-1.0, 0.0, 2.0]]
+        expected = np.array([get_waterline_properties(w) for w in (w1, w2, [])]).T
+        properties = get_waterlines_properties([w1, w2, []])
+        self.assertTrue(np.allclose(expected, properties))
+        padded = np.full((3, 5, 3), np.nan)
+        padded[0, :4] = w1
+        padded[1, :4] = w2
+        properties = get_waterlines_properties(padded)
+        self.assertTrue(np.allclose(expected, properties))
+
     def test_get_km(self):
         km = get_km(self.frames, 1.0)
         dispvol = get_displacement(self.frames, 1.0)
@@ -67,6 +440,126 @@ class TestFunctions(unittest.TestCase):
         expected = 1 + lcb / 4.0 * (tap - tfp)
         self.assertAlmostEqual(expected, km, delta=1e-2)
 
+    def test_get_submerged_sections(self):
+        lines = load_lines_plan(scriptdir / "../data/tally_ho.json")
+        drafts = np.linspace(0.5, 2.0, len(lines.frames))
+        submerged = get_submerged_sections(lines.frames, drafts)
+        for frame, draft, section in zip(lines.frames, drafts, submerged):
+            expected = get_submerged_frame(frame, draft)
+            self.assertEqual(len(expected), len(section))
+            self.assertTrue(np.allclose(np.reshape(expected.yz, (-1, 2)), section.yz))
+
+    def test_hydrostatic_state(self):
+        tap, tfp = 0.75, 0.5
+        state = HydrostaticState(self.frames, tap, tfp)
+        self.assertAlmostEqual(get_km(self.frames, tap, tfp), state.km)
+        self.assertAlmostEqual(get_bm(self.frames, tap, tfp), state.bm)
+        self.assertAlmostEqual(get_kb(self.frames, tap, tfp), state.kb)
+        self.assertAlmostEqual(get_lcb(self.frames, tap, tfp), state.lcb)
+        self.assertAlmostEqual(get_lcf(self.frames, tap, tfp), state.lcf)
+        self.assertAlmostEqual(
+            get_displacement(self.frames, tap, tfp), state.displacement
+        )
+        self.assertAlmostEqual(
+            get_wetted_surface(self.frames, tap, tfp), state.wetted_surface
+        )
+        self.assertIs(state.submerged_frames, state.submerged_frames)
+        self.assertIs(state.waterline, state.waterline)
+
+    def test_hydrostatic_table(self):
+        drafts_ap = np.array([0.5, 1.0, 0.75])
+        drafts_fp = np.array([0.5, 1.0, 0.5])
+        table = hydrostatic_table(self.frames, drafts_ap, drafts_fp)
+        self.assertEqual(3, len(table))
+        for row in table:
+            tap, tfp = row["draft_ap"], row["draft_fp"]
+            self.assertAlmostEqual(
+                get_displacement(self.frames, tap, tfp), row["displacement"]
+            )
+            self.assertAlmostEqual(get_lcb(self.frames, tap, tfp), row["lcb"])
+            self.assertAlmostEqual(get_bm(self.frames, tap, tfp), row["bm"])
+            self.assertAlmostEqual(get_lcf(self.frames, tap, tfp), row["lcf"])
+            expected = 1 + row["lcb"] / 4.0 * (tap - tfp)
+            self.assertAlmostEqual(expected, row["km"], delta=1e-3)
+            self.assertAlmostEqual(get_kb(self.frames, tap, tfp), row["kb"], delta=1e-2)
+            self.assertAlmostEqual(
+                get_wetted_surface(self.frames, tap, tfp), row["wetted_surface"]
+            )
+        # Chunks of one draft and a dry condition
+        with warnings.catch_warnings():
+            warnings.simplefilter("error")
+            chunked = hydrostatic_table(
+                self.frames, np.append(drafts_ap, 0.0), chunk_points=1
+            )
+        for name in table.dtype.names:
+            self.assertTrue(np.array_equal(table[name][:2], chunked[name][:2]))
+        self.assertEqual(0.0, chunked["displacement"][-1])
+        for name in ("lcb", "kb", "bm", "km", "lcf"):
+            self.assertTrue(np.isnan(chunked[name][-1]), msg=name)
+
+    def test_get_kb(self):
+        for tap, tfp in ((1.0, 1.0), (0.5, 0.5), (0.75, 0.5), (0.5, 0.75)):
+            kb = get_kb(self.frames, tap, tfp)
+            kb_waterlines = get_kb(self.frames, tap, tfp, method="waterlines")
+            self.assertAlmostEqual(kb_waterlines, kb, delta=1e-2)
+        # Center of half circle: 4 / (3 pi) below its top
+        self.assertAlmostEqual(
+            1 - 4 / (3 * math.pi), get_kb(self.frames, 1.0), delta=1e-4
+        )
+
+    def test_float_frames(self):
+        tap, tfp = 0.75, 0.5
+        dispvol = get_displacement(self.frames, tap, tfp)
+        lcb = get_lcb(self.frames, tap, tfp)
+        full_frames = get_full_frames(self.frames)
+        points = full_frames.points.copy()
+        draft, trim = float_frames(full_frames, dispvol, lcb)
+        self.assertAlmostEqual(tap, draft, delta=1e-8)
+        self.assertAlmostEqual(tap - tfp, trim, delta=1e-8)
+        self.assertTrue((points == full_frames.points).all())
+        expected = submerge_frames(get_full_frames(self.frames), draft, trim)
+        result = get_submerged_properties(full_frames, draft, trim)
+        self.assertTrue(np.allclose(expected, result))
+
+    def test_gz_curve(self):
+        dispvol = get_displacement(self.frames, 0.75)
+        heel_angles = np.radians([0.0, 15.0, 30.0, 60.0])
+        gz = gz_curve(self.frames, dispvol, 2.0, 0.5, heel_angles)
+        # A circular cylinder keeps its center of buoyancy below its axis
+        expected = 0.5 * np.sin(heel_angles)
+        self.assertTrue(np.allclose(expected, gz["gz"], atol=1e-3))
+        # Heeling is about the keel, which lifts the axis of the cylinder
+        sinkage = np.cos(heel_angles) - 1.0
+        self.assertTrue(np.allclose(sinkage, gz["sinkage"], atol=1e-3))
+        self.assertTrue(np.allclose(0.75 + sinkage, gz["draft"], atol=1e-3))
+        self.assertTrue(np.allclose(0.0, gz["trim"], atol=1e-6))
+
+    def test_bonjean_curves(self):
+        lines = load_lines_plan(scriptdir / "../data/tally_ho.json")
+        curves = BonjeanCurves(lines.frames)
+        drafts = np.linspace(-0.5, 4.0, 12)
+        for draft in drafts:
+            frame_drafts = np.full(len(lines.frames), draft)
+            submerged = get_submerged_sections(lines.frames, frame_drafts)
+            areas, mom_ys, mom_zs = curves.evaluate(frame_drafts)
+            self.assertTrue(np.allclose(get_cross_sections(submerged, True), areas))
+            self.assertTrue(np.allclose(get_mom_ys(submerged), mom_ys))
+            self.assertTrue(np.allclose(get_mom_zs(submerged), mom_zs))
+        areas = curves.evaluate(np.repeat(drafts[:, None], len(lines.frames), 1))[0]
+        self.assertEqual((len(drafts), len(lines.frames)), areas.shape)
+        tap, tfp = 1.6, 1.4
+        self.assertAlmostEqual(
+            get_displacement(lines.frames, tap, tfp), curves.displacement(tap, tfp)
+        )
+        self.assertAlmostEqual(get_lcb(lines.frames, tap, tfp), curves.lcb(tap, tfp))
+        self.assertAlmostEqual(get_kb(lines.frames, tap, tfp), curves.kb(tap, tfp))
+        # Empty frame in the middle
+        frames = [self.frames[0], Frame([], x=1.0), self.frames[2]]
+        areas, mom_ys, mom_zs = BonjeanCurves(frames).evaluate(np.full(3, 0.5))
+        expected = BonjeanCurves(self.frames[:1]).evaluate(np.full(1, 0.5))
+        for values, value in zip((areas, mom_ys, mom_zs), expected):
+            self.assertTrue(np.allclose([value[0], 0.0, value[0]], values))
+
     def test_get_hull_areas(self):
         ha, da = get_hull_areas(self.frames)
         self.assertAlmostEqual(ha, da, delta=1e-3)
@@ -76,3 +569,20 @@ class TestFunctions(unittest.TestCase):
         draft = 1 - 0.5 * math.sqrt(2)
         s = get_wetted_surface(self.frames, draft)
         self.assertAlmostEqual(2 * math.pi, s, delta=1e-3)
+
+
+class TestImports(unittest.TestCase):
+
+    def test_lazy_imports(self):
+        script = (
+            "import sys, linesplan, linesplan.batch; "
+            "print([m for m in ('matplotlib', 'scipy') if m in sys.modules])"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", script], capture_output=True, text=True, check=True
+        )
+        self.assertEqual("[]", result.stdout.strip())
+        import linesplan.lines
+        from linesplan.plot import plot_frames
+
+        self.assertIs(plot_frames, linesplan.lines.plot_frames)
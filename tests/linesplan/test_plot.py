@@ -0,0 +1,48 @@
+import os
+import unittest
+from pathlib import Path
+
+from linesplan.lines import *
+from linesplan.plot import *
+
+scriptdir = Path(os.path.dirname(os.path.realpath(__file__)))
+outputdir = scriptdir / "../output"
+
+
+class TestRenderer(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.frames = load_lines_plan(scriptdir / "../data/tally_ho.json").frames
+        outputdir.mkdir(exist_ok=True)
+
+    def test_render(self):
+        renderer = Renderer(size=(4, 3), dpi=50)
+        filename = outputdir / "tally_ho_frames.png"
+        renderer.render("frames", self.frames, filename, show_waterline=1.5)
+        self.assertEqual(1, len(renderer.axes.collections))
+        self.assertGreater(filename.stat().st_size, 0)
+        filename = outputdir / "tally_ho_waterlines.png"
+        renderer.render("waterlines", self.frames, filename, drafts_ap=[0.5, 1.0, 1.5])
+        segments = renderer.axes.collections[0].get_segments()
+        self.assertEqual(3, len(segments))
+        with self.assertRaises(ValueError):
+            renderer.render("sections", self.frames, filename)
+
+    def test_export_plots(self):
+        jobs = [
+            ("frames", self.frames, outputdir / f"export_{i}.png", {"title": str(i)})
+            for i in range(3)
+        ]
+        jobs.append(
+            (
+                "waterlines",
+                self.frames,
+                outputdir / "export_3.png",
+                {"drafts_ap": [1.0]},
+            )
+        )
+        filenames = list(export_plots(jobs, size=(4, 3), dpi=50, max_workers=2))
+        self.assertEqual([job[2] for job in jobs], filenames)
+        for filename in filenames:
+            self.assertGreater(filename.stat().st_size, 0)
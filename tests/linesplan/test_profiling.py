@@ -0,0 +1,53 @@
+import json
+import os
+import subprocess
+import sys
+import unittest
+from pathlib import Path
+
+from conftest import get_cylinder_frames
+
+from linesplan.lines import *
+from linesplan.profiling import *
+
+scriptdir = Path(os.path.dirname(os.path.realpath(__file__)))
+
+
+class TestProfiling(unittest.TestCase):
+
+    def setUp(self):
+        self.frames = get_cylinder_frames()
+
+    def test_profile(self):
+        self.assertFalse(is_enabled())
+        with profile() as stats:
+            self.assertTrue(is_enabled())
+            get_displacement(self.frames, 0.5)
+            get_displacement(self.frames, 0.6)
+            float_frames(get_full_frames(self.frames), 4 * np.pi / 2, 2.0)
+        self.assertFalse(is_enabled())
+        get_displacement(self.frames, 0.5)
+        functions = stats.to_dict()["functions"]
+        self.assertEqual(2, functions["get_displacement"]["calls"])
+        self.assertEqual(2 * 5 * 101, functions["get_displacement"]["points"])
+        self.assertGreater(functions["get_displacement"]["time"], 0.0)
+        self.assertIn("simpson", functions)
+        counters = stats.to_dict()["counters"]
+        self.assertEqual(1, functions["float_frames"]["calls"])
+        self.assertEqual(
+            counters["float_frames.iterations"] + 1, counters["float_frames.residuals"]
+        )
+        self.assertEqual(stats.to_dict(), json.loads(stats.to_json()))
+
+    def test_environment(self):
+        filename = scriptdir / "../output/profile.json"
+        plan = scriptdir / "../data/tally_ho.json"
+        script = (
+            "from linesplan.lines import *; "
+            f"get_hull_volume(load_lines_plan({str(plan)!r}).frames)"
+        )
+        env = dict(os.environ, LINESPLAN_PROFILE=str(filename))
+        subprocess.run([sys.executable, "-c", script], env=env, check=True)
+        with open(filename) as f:
+            stats = json.load(f)
+        self.assertEqual(1, stats["functions"]["get_hull_volume"]["calls"])
@@ -0,0 +1,39 @@
+import os
+import unittest
+from pathlib import Path
+
+from linesplan.lines import *
+from linesplan.surface import *
+
+scriptdir = Path(os.path.dirname(os.path.realpath(__file__)))
+
+
+class TestHullSurface(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.lines = load_lines_plan(scriptdir / "../data/tally_ho.json")
+        cls.surface = HullSurface(cls.lines.frames)
+
+    def test_frames(self):
+        xs = [frame.x for frame in self.lines.frames]
+        stations = self.surface.get_stations(xs)
+        self.assertTrue(np.allclose(self.surface.frames.dense, stations.dense))
+        self.assertEqual(self.surface.frames[0].chines, stations[10].chines)
+
+    def test_stations(self):
+        stations = self.surface.get_stations([3.1, 7.5])
+        self.assertEqual((2, self.surface.count, 2), stations.dense.shape)
+        self.assertTrue(
+            np.array_equal(stations.dense, self.surface.get_stations([3.1, 7.5]).dense)
+        )
+        with self.assertRaises(ValueError):
+            self.surface.get_stations([-1.0])
+
+    def test_displacement(self):
+        expected = get_displacement(self.lines.frames, 1.5)
+        for count in (45, 89, 177):
+            stations = self.surface.get_uniform_stations(count)
+            self.assertAlmostEqual(
+                expected, get_displacement(stations, 1.5), delta=expected * 1e-3
+            )